@@ -1,17 +1,19 @@
+import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.audit import audit_label, write_audit
-from app.core.auth import AuthUser, require_admin, require_view
+from app.core.auth import AuthUser, hash_api_key, require_admin, require_view
 from app.core.codec import sanitize_video_codec
 from app.core.csv_export import filename_for, stream_csv_response
 from app.core.database import get_db
 from app.core.limiter import limiter
-from app.models.models import AuditLog, Camera, CameraGroup, Setting
+from app.models.models import AuditLog, Camera, CameraGroup, Setting, _audit_row_to_dict
 from app.schemas.schemas import (
     CameraGroupCreate,
     CameraRecordingPolicy,
@@ -61,7 +63,13 @@ async def list_cameras(
 
     result = [c.to_dict() for c in cameras]
     logger.debug("Returning %d cameras for org %s", len(result), user.org_id)
-    return result
+    # ``Camera.to_dict`` already emits JSON-native values (ISO strings,
+    # bools, plain lists), so hand the list straight to JSONResponse.
+    # Returning it bare sends it through ``jsonable_encoder`` first — a
+    # recursive Python walk that rebuilds every dict only to produce an
+    # identical copy — and this endpoint is the one every open
+    # dashboard polls.
+    return JSONResponse(content=result)
 
 
 @router.get("/cameras/{camera_id}")
@@ -74,7 +82,7 @@ async def get_camera(
     camera = db.query(Camera).filter_by(camera_id=camera_id, org_id=user.org_id).first()
     if not camera:
         raise HTTPException(status_code=404, detail="Camera not found")
-    return camera.to_dict()
+    return JSONResponse(content=camera.to_dict())
 
 
 @router.post("/cameras/{camera_id}/snapshot")
@@ -257,9 +265,32 @@ async def update_camera_recording_policy(
 async def list_camera_groups(
     user: AuthUser = Depends(require_view), db: Session = Depends(get_db)
 ):
-    """List all camera groups for the user's organization."""
-    groups = db.query(CameraGroup).filter_by(org_id=user.org_id).all()
-    return [g.to_dict() for g in groups]
+    """List all camera groups for the user's organization.
+
+    One aggregate query over plain columns instead of hydrating each
+    CameraGroup and lazy-loading its ``cameras`` collection just to
+    ``len()`` it (1 + N queries).  Same shape as ``CameraGroup.to_dict``.
+    """
+    from sqlalchemy import func
+
+    rows = (
+        db.query(
+            CameraGroup.id,
+            CameraGroup.name,
+            CameraGroup.color,
+            CameraGroup.icon,
+            func.count(Camera.id),
+        )
+        .outerjoin(Camera, Camera.group_id == CameraGroup.id)
+        .filter(CameraGroup.org_id == user.org_id)
+        .group_by(CameraGroup.id)
+        .order_by(CameraGroup.id)
+        .all()
+    )
+    return [
+        {"id": gid, "name": name, "color": color, "icon": icon, "camera_count": count}
+        for gid, name, color, icon, count in rows
+    ]
 
 
 @router.post("/camera-groups")
@@ -294,18 +325,32 @@ async def delete_camera_group(
     user: AuthUser = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    """Delete a camera group."""
-    group = db.query(CameraGroup).filter_by(id=group_id, org_id=user.org_id).first()
-    if not group:
-        raise HTTPException(status_code=404, detail="Group not found")
-
-    for camera in group.cameras:
-        camera.group_id = None
+    """Delete a camera group.
+
+    Two set-based statements instead of load-group → lazy-load every
+    member camera → per-row UPDATE → DELETE.  Members are detached
+    first (the FK has no ON DELETE action and ``foreign_keys=ON`` would
+    reject the DELETE otherwise), then the group row is removed with
+    the org scope in the WHERE clause and its name handed back via
+    RETURNING.  A miss — unknown id or another org's group — rolls the
+    UPDATE back (it matched nothing anyway) and 404s.
+    """
+    from sqlalchemy import delete
 
-    db.delete(group)
+    db.query(Camera).filter_by(group_id=group_id, org_id=user.org_id).update(
+        {"group_id": None}, synchronize_session=False
+    )
+    deleted_name = db.execute(
+        delete(CameraGroup)
+        .where(CameraGroup.id == group_id, CameraGroup.org_id == user.org_id)
+        .returning(CameraGroup.name)
+    ).scalar_one_or_none()
+    if deleted_name is None:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Group not found")
     db.commit()
 
-    return {"success": True, "deleted": group.name}
+    return {"success": True, "deleted": deleted_name}
 
 
 @router.put("/cameras/{camera_id}/group")
@@ -574,7 +619,18 @@ async def list_audit_logs(
     spreadsheet review or compliance archiving.  Filters apply to
     both JSON and CSV.
     """
-    query = db.query(AuditLog).filter(AuditLog.org_id == user.org_id)
+    # Column tuples rather than AuditLog entities: both branches below
+    # only read these fields, so skip ORM identity-map hydration —
+    # noticeable on the 50k-row CSV export.
+    query = db.query(
+        AuditLog.id,
+        AuditLog.timestamp,
+        AuditLog.event,
+        AuditLog.ip_address,
+        AuditLog.username,
+        AuditLog.user_id,
+        AuditLog.details,
+    ).filter(AuditLog.org_id == user.org_id)
 
     if event:
         query = query.filter(AuditLog.event == event)
@@ -631,7 +687,7 @@ async def list_audit_logs(
         "total": total,
         "limit": limit,
         "offset": offset,
-        "logs": [l.to_dict() for l in logs],
+        "logs": [_audit_row_to_dict(log) for log in logs],
     }
 
 
@@ -647,8 +703,6 @@ async def report_camera_codec(
     Report video/audio codec for a camera.
     Called by CloudNode after detecting codec from first segment.
     """
-    import hashlib
-
     from app.models.models import CameraNode
 
     # Verify node API key
@@ -656,7 +710,7 @@ async def report_camera_codec(
     if not node_api_key:
         raise HTTPException(status_code=401, detail="Missing API key")
 
-    api_key_hash = hashlib.sha256(node_api_key.encode()).hexdigest()
+    api_key_hash = hash_api_key(node_api_key)
     node = db.query(CameraNode).filter_by(api_key_hash=api_key_hash).first()
     if not node:
         raise HTTPException(status_code=401, detail="Invalid API key")
@@ -850,16 +904,21 @@ async def full_reset(
     # — a node that's already offline can't ack the command anyway,
     # and we can't leave the customer's CC data sitting around
     # waiting for a node that may never come back.
+    #
+    # The commands go out concurrently: each one waits up to 10s for
+    # its ack, so a sequential loop over a fleet with a few slow nodes
+    # held the request open for 10s per node.  return_exceptions keeps
+    # one node's failure from cancelling the rest.
     nodes = db.query(CameraNode).filter_by(org_id=user.org_id).all()
-    for node in nodes:
-        try:
-            result = await manager.send_command(
-                node.node_id, "wipe_data", {}, timeout=10
-            )
-            if result and result.get("status") == "success":
-                nodes_wiped += 1
-        except Exception as e:
-            logger.warning("Could not send wipe_data to node %s: %s", node.node_id, e)
+    wipe_results = await asyncio.gather(
+        *(manager.send_command(node.node_id, "wipe_data", {}, timeout=10) for node in nodes),
+        return_exceptions=True,
+    )
+    for node, result in zip(nodes, wipe_results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning("Could not send wipe_data to node %s: %s", node.node_id, result)
+        elif result and result.get("status") == "success":
+            nodes_wiped += 1
 
         # Drop the segment cache for every camera under this node;
         # Query.delete() can't reach the in-memory dict.
@@ -1,15 +1,17 @@
-import hashlib
+import asyncio
 import logging
 import re
 import threading
 import time
+from collections import deque
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import Response
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, hash_api_key
 from app.core.config import settings
 from app.core.database import SessionLocal, get_db
 from app.core.limiter import limiter
@@ -50,12 +52,14 @@ async def _read_capped_body(request: Request, max_bytes: int) -> bytes:
          with HTTP 413 BEFORE any bytes land in memory.  This is
          the lever that makes a 10 GB attempted upload cost zero
          memory at the server.
-      2. **Post-read** check on the actual body length.  Belt-and-
+      2. **Running** check while the body streams in.  Belt-and-
          suspenders for chunked-transfer requests that omit
-         Content-Length, or for clients that lie.  Bytes are read
-         (Starlette has no streaming-cap primitive available here)
-         but the cap still fires before the body is forwarded into
-         the cache.
+         Content-Length, or for clients that lie.  Chunks are pulled
+         off ``request.stream()`` and the read is abandoned as soon
+         as the running total crosses the cap, so an oversize body
+         costs at most ``max_bytes`` plus one receive chunk instead
+         of being buffered whole (``request.body()``) and only then
+         measured.
 
     Returns the validated body bytes.  Raises HTTPException(413) on
     either path; HTTPException(400) if Content-Length is malformed.
@@ -76,20 +80,35 @@ async def _read_capped_body(request: Request, max_bytes: int) -> bytes:
                 ),
             )
 
-    body = await request.body()
-    if len(body) > max_bytes:
-        raise HTTPException(
-            status_code=413,
-            detail=f"Body is {len(body)} bytes; max is {max_bytes}",
-        )
-    return body
+    chunks: list[bytes] = []
+    received = 0
+    async for chunk in request.stream():
+        if not chunk:
+            continue
+        received += len(chunk)
+        if received > max_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Body exceeds max of {max_bytes} bytes",
+            )
+        chunks.append(chunk)
+    # Single chunk is the common case (one ASGI receive for a ~1 MB
+    # segment); skip the join copy when there's nothing to join.
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
 
 # ── Rewritten playlist cache ──────────────────────────────────────────
 # Populated by POST /playlist (CloudNode push). Browser GET requests
-# serve the cached string instantly — no I/O per poll.
+# serve the cached body instantly — no I/O per poll.
+#
+# The playlist is stored already UTF-8 encoded.  hls.js polls it about
+# once a second per viewer, and handing Starlette a ``str`` makes it
+# encode a fresh bytes copy on every one of those polls.  Encoding once
+# at push time means every viewer's response shares the same immutable
+# buffer; a newer push just swaps the reference.
 #
-# {camera_id: (rewritten_playlist_text, timestamp)}
-_playlist_cache: dict[str, tuple[str, float]] = {}
+# {camera_id: (rewritten_playlist_bytes, timestamp)}
+_playlist_cache: dict[str, tuple[bytes, float]] = {}
 # 30 seconds.  With 1s segments and hls_list_size=15 the real segment window
 # is ~15s, so we want the cache TTL comfortably larger than the gap between
 # CloudNode playlist pushes — otherwise one or two dropped pushes expires
@@ -99,6 +118,18 @@ _playlist_cache: dict[str, tuple[str, float]] = {}
 _PLAYLIST_CACHE_MAX_AGE = 30.0
 _CACHE_MAX_CAMERAS = 500
 
+# Response headers for the two viewer hot paths, built once.  The
+# playlist is re-polled every second and must never be cached (a stale
+# playlist points at evicted segments); segments are immutable once
+# pushed, so the browser may keep them.  Starlette only reads these
+# dicts to build each response's raw header list, so sharing them is
+# safe.
+_PLAYLIST_RESPONSE_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
+    "Pragma": "no-cache",
+}
+_SEGMENT_RESPONSE_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
 # ── In-memory segment cache ──────────────────────────────────────────
 # CloudNode pushes segments via POST /push-segment. Browser fetches
 # them via GET /segment/{filename}.
@@ -136,6 +167,18 @@ _ACCESS_LOG_INTERVAL = 300.0  # 5 minutes
 _last_access_logged: dict[tuple[str, str], float] = {}
 _ACCESS_LOG_MAX_ENTRIES = 10000
 
+# Access-log rows are queued here by the stream.m3u8 handler and written
+# by the same periodic task that flushes viewer usage (see
+# ``flush_access_logs``), so a viewer's playlist fetch never waits on a
+# SQLite INSERT + commit on the event loop.  The lifespan shutdown runs a
+# final flush so a deploy doesn't lose the queue, and the org-wipe path
+# discards an org's queued rows (``discard_pending_access_logs``).
+# Bounded so a DB outage can't grow it without limit; the oldest rows
+# are the ones dropped.
+_ACCESS_LOG_MAX_PENDING = 10_000
+_access_log_lock = threading.Lock()
+_pending_access_logs: deque[dict] = deque(maxlen=_ACCESS_LOG_MAX_PENDING)
+
 # ── Viewer-hour usage tracking ──────────────────────────────────────
 # Each cached HLS segment we serve is ~1 second of video, so we increment a
 # per-org counter by 1 for every successful segment delivery. The hot path
@@ -187,9 +230,15 @@ def _warm_cached_viewer_seconds(org_id: str) -> int:
     of the month for each org so the cap check has real data."""
     ym = _current_year_month()
     key = (org_id, ym)
-    with _viewer_usage_lock:
-        if key in _cached_viewer_seconds:
-            return _cached_viewer_seconds[key] + _pending_viewer_seconds.get(key, 0)
+    # Warm-cache fast path, taken on every segment serve: two dict
+    # reads, no lock.  Single ``dict.get`` calls are atomic under the
+    # GIL, and the lock never made the pair consistent anyway — the
+    # flush drains pending and bumps the cached total in separate
+    # critical sections.  The lock is for writers (record / warm /
+    # flush) so the per-segment cap check doesn't queue behind them.
+    cached = _cached_viewer_seconds.get(key)
+    if cached is not None:
+        return cached + _pending_viewer_seconds.get(key, 0)
 
     db = SessionLocal()
     try:
@@ -226,29 +275,49 @@ def flush_viewer_usage() -> int:
         snapshot = dict(_pending_viewer_seconds)
         _pending_viewer_seconds.clear()
 
+    now = datetime.now(tz=UTC).replace(tzinfo=None)
+    rows = [
+        {
+            "org_id": org_id,
+            "year_month": ym,
+            "viewer_seconds": delta,
+            "updated_at": now,
+        }
+        for (org_id, ym), delta in snapshot.items()
+        if delta > 0
+    ]
+    if not rows:
+        return len(snapshot)
+
+    # One multi-row INSERT ... ON CONFLICT DO UPDATE for the whole
+    # snapshot, riding on the (org_id, year_month) unique constraint.
+    # The old loop paid a SELECT plus an INSERT or UPDATE per org — N
+    # round trips inside one write transaction, every minute.  RETURNING
+    # hands back the post-increment totals so the cache refresh below
+    # doesn't need a read either.
+    stmt = sqlite_insert(OrgMonthlyUsage).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[OrgMonthlyUsage.org_id, OrgMonthlyUsage.year_month],
+        set_={
+            "viewer_seconds": (
+                OrgMonthlyUsage.viewer_seconds + stmt.excluded.viewer_seconds
+            ),
+            "updated_at": stmt.excluded.updated_at,
+        },
+    ).returning(
+        OrgMonthlyUsage.org_id,
+        OrgMonthlyUsage.year_month,
+        OrgMonthlyUsage.viewer_seconds,
+    )
+
     db = SessionLocal()
     try:
-        for (org_id, ym), delta in snapshot.items():
-            if delta <= 0:
-                continue
-            row = (
-                db.query(OrgMonthlyUsage)
-                .filter_by(org_id=org_id, year_month=ym)
-                .first()
-            )
-            if row:
-                row.viewer_seconds = int(row.viewer_seconds or 0) + delta
-            else:
-                row = OrgMonthlyUsage(
-                    org_id=org_id,
-                    year_month=ym,
-                    viewer_seconds=delta,
-                )
-                db.add(row)
-            # Update the in-memory cache so the next read sees the new DB total.
-            with _viewer_usage_lock:
-                _cached_viewer_seconds[(org_id, ym)] = int(row.viewer_seconds)
+        totals = db.execute(stmt).all()
         db.commit()
+        # Update the in-memory cache so the next read sees the new DB total.
+        with _viewer_usage_lock:
+            for org_id, ym, total in totals:
+                _cached_viewer_seconds[(org_id, ym)] = int(total)
         return len(snapshot)
     except Exception:
         logger.exception("[ViewerUsage] Flush failed — pending increments lost")
@@ -395,7 +464,6 @@ def _evict_caches():
 
 
 def _maybe_log_access(
-    db: Session,
     user_id: str,
     user_email: str,
     org_id: str,
@@ -404,7 +472,7 @@ def _maybe_log_access(
     ip_address: str,
     user_agent: str,
 ) -> None:
-    """Create a StreamAccessLog entry if enough time has passed."""
+    """Queue a StreamAccessLog entry if enough time has passed."""
     now = time.monotonic()
     key = (user_id, camera_id)
     last = _last_access_logged.get(key, 0.0)
@@ -413,24 +481,60 @@ def _maybe_log_access(
 
     _last_access_logged[key] = now
 
+    entry = {
+        "user_id": user_id,
+        "user_email": user_email,
+        "org_id": org_id,
+        "camera_id": camera_id,
+        "node_id": node_id,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        # Stamped now, not at flush time, so the row records when the
+        # viewer actually started watching.
+        "accessed_at": datetime.now(tz=UTC).replace(tzinfo=None),
+    }
+    with _access_log_lock:
+        _pending_access_logs.append(entry)
+
+
+def flush_access_logs() -> int:
+    """Write queued stream access-log rows to the DB. Called by the
+    viewer-usage background task every ~60s. Returns the number of rows
+    written (0 on failure — the batch is dropped and logged, matching
+    ``flush_viewer_usage``)."""
+    with _access_log_lock:
+        if not _pending_access_logs:
+            return 0
+        batch = list(_pending_access_logs)
+        _pending_access_logs.clear()
+
+    db = SessionLocal()
     try:
-        from datetime import datetime
-
-        log_entry = StreamAccessLog(
-            user_id=user_id,
-            user_email=user_email,
-            org_id=org_id,
-            camera_id=camera_id,
-            node_id=node_id,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            accessed_at=datetime.now(tz=UTC).replace(tzinfo=None),
-        )
-        db.add(log_entry)
+        db.add_all(StreamAccessLog(**entry) for entry in batch)
         db.commit()
+        return len(batch)
     except Exception as e:
         logger.warning("Failed to log stream access: %s", e)
         db.rollback()
+        return 0
+    finally:
+        db.close()
+
+
+def discard_pending_access_logs(org_id: str) -> int:
+    """Drop queued access-log rows for ``org_id`` without writing them.
+
+    Called from the org-wipe path so rows queued before a GDPR delete or
+    full reset can't be inserted by the next flush, after the org's
+    StreamAccessLog rows are already gone.  Returns the number dropped.
+    """
+    with _access_log_lock:
+        kept = [e for e in _pending_access_logs if e["org_id"] != org_id]
+        dropped = len(_pending_access_logs) - len(kept)
+        if dropped:
+            _pending_access_logs.clear()
+            _pending_access_logs.extend(kept)
+    return dropped
 
 
 def _rewrite_playlist(raw_playlist: str) -> str:
@@ -463,6 +567,91 @@ def _rewrite_playlist(raw_playlist: str) -> str:
     return playlist_text
 
 
+def _authorize_segment_fetch(
+    db: Session, org_id: str, camera_id: str, filename: str
+) -> None:
+    """Blocking half of ``GET /segment/{filename}``: camera ownership,
+    filename validation and the monthly viewer-hour cap, in that order.
+    Raises HTTPException (404 / 400 / 429); returns None when the viewer
+    may be served.
+
+    Ownership goes first so an unknown or foreign camera is a 404 no
+    matter what filename is asked for.
+    """
+    camera = db.query(Camera).filter_by(camera_id=camera_id, org_id=org_id).first()
+    if not camera:
+        raise HTTPException(status_code=404, detail="Camera not found")
+
+    if not _RE_SEGMENT_FILENAME.match(filename):
+        raise HTTPException(status_code=400, detail="Invalid segment filename")
+
+    # Check the monthly viewer-hour cap before serving. Warm the cache on the
+    # first segment we see for this org (same call amortizes one DB read per
+    # org per process lifetime).
+    #
+    # Use ``effective_plan_for_caps`` instead of ``user.plan`` (the JWT claim)
+    # so a stale token can't keep buying paid-tier viewer-hours after the
+    # 7-day grace window expires — the JWT only refreshes once a minute, and
+    # a Clerk webhook propagation hiccup can delay it further. Reading the
+    # DB-resolved plan here keeps this enforcement point consistent with the
+    # push-segment / camera-cap path, which already uses the effective plan.
+    from app.core.plans import effective_plan_for_caps, get_plan_limits
+    effective_plan = effective_plan_for_caps(db, org_id)
+    limits = get_plan_limits(effective_plan)
+    max_hours = limits.get("max_viewer_hours_per_month")
+    if max_hours is not None and max_hours > 0:
+        used_seconds = _warm_cached_viewer_seconds(org_id)
+        if used_seconds >= max_hours * 3600:
+            raise HTTPException(
+                status_code=429,
+                detail=(
+                    f"Monthly viewer-hour cap reached ({max_hours}h on your "
+                    f"current plan). Live playback will resume on the 1st of "
+                    f"next month, or upgrade your plan for more viewing time."
+                ),
+                headers={"Retry-After": "3600"},
+            )
+
+
+def _authenticate_node_push(
+    request: Request, db: Session, camera_id: str
+) -> tuple[CameraNode, Camera]:
+    """Authenticate a CloudNode push and resolve the camera it targets.
+
+    Shared by push-segment / playlist / motion.  The happy path — valid
+    key, camera owned by that node — is ONE joined query instead of a
+    node lookup followed by a camera lookup; push-segment runs this
+    ~once a second per camera, so the saved round-trip adds up.  Only
+    on a miss do we spend a second query to pick the right status:
+    401 if the key matches no node, 404 if the node exists but doesn't
+    own the camera.
+
+    The join pins both node ownership AND org match — defense-in-depth
+    so a future schema drift can't let a node in org A touch a camera
+    in org B.
+    """
+    node_api_key = request.headers.get("X-Node-API-Key")
+    if not node_api_key:
+        raise HTTPException(status_code=401, detail="Missing API key")
+
+    api_key_hash = hash_api_key(node_api_key)
+    row = (
+        db.query(CameraNode, Camera)
+        .join(
+            Camera,
+            (Camera.node_id == CameraNode.id) & (Camera.org_id == CameraNode.org_id),
+        )
+        .filter(CameraNode.api_key_hash == api_key_hash, Camera.camera_id == camera_id)
+        .first()
+    )
+    if row is not None:
+        return row[0], row[1]
+
+    if not db.query(CameraNode.id).filter_by(api_key_hash=api_key_hash).first():
+        raise HTTPException(status_code=401, detail="Invalid API key")
+    raise HTTPException(status_code=404, detail="Camera not found")
+
+
 # ── Endpoints ─────────────────────────────────────────────────────────
 
 
@@ -485,22 +674,17 @@ async def get_hls_playlist(
     if not node:
         raise HTTPException(status_code=404, detail="Camera node not found")
 
+    client = request.scope.get("client")
     _maybe_log_access(
-        db=db,
         user_id=user.user_id,
         user_email=user.email,
         org_id=user.org_id,
         camera_id=camera_id,
         node_id=str(node.id),
-        ip_address=request.client.host if request.client else "unknown",
+        ip_address=client[0] if client else "unknown",
         user_agent=request.headers.get("user-agent", "")[:500],
     )
 
-    headers = {
-        "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-        "Pragma": "no-cache",
-    }
-
     # Serve from cache (populated by POST /playlist from CloudNode).
     cached = _playlist_cache.get(camera_id)
     if cached and (time.monotonic() - cached[1]) < _PLAYLIST_CACHE_MAX_AGE:
@@ -516,7 +700,7 @@ async def get_hls_playlist(
         return Response(
             content=cached[0],
             media_type="application/vnd.apple.mpegurl",
-            headers=headers,
+            headers=_PLAYLIST_RESPONSE_HEADERS,
         )
 
     # No cached playlist — CloudNode hasn't pushed one yet (or it went
@@ -553,39 +737,14 @@ async def get_hls_segment(
     returning bytes. The cap-enforcement read hits the in-memory counter,
     not the DB, so it's O(1) on the hot path.
     """
-    camera = db.query(Camera).filter_by(camera_id=camera_id, org_id=user.org_id).first()
-    if not camera:
-        raise HTTPException(status_code=404, detail="Camera not found")
-
-    if not _RE_SEGMENT_FILENAME.match(filename):
-        raise HTTPException(status_code=400, detail="Invalid segment filename")
-
-    # Check the monthly viewer-hour cap before serving. Warm the cache on the
-    # first segment we see for this org (same call amortizes one DB read per
-    # org per process lifetime).
-    #
-    # Use ``effective_plan_for_caps`` instead of ``user.plan`` (the JWT claim)
-    # so a stale token can't keep buying paid-tier viewer-hours after the
-    # 7-day grace window expires — the JWT only refreshes once a minute, and
-    # a Clerk webhook propagation hiccup can delay it further. Reading the
-    # DB-resolved plan here keeps this enforcement point consistent with the
-    # push-segment / camera-cap path, which already uses the effective plan.
-    from app.core.plans import effective_plan_for_caps, get_plan_limits
-    effective_plan = effective_plan_for_caps(db, user.org_id)
-    limits = get_plan_limits(effective_plan)
-    max_hours = limits.get("max_viewer_hours_per_month")
-    if max_hours is not None and max_hours > 0:
-        used_seconds = _warm_cached_viewer_seconds(user.org_id)
-        if used_seconds >= max_hours * 3600:
-            raise HTTPException(
-                status_code=429,
-                detail=(
-                    f"Monthly viewer-hour cap reached ({max_hours}h on your "
-                    f"current plan). Live playback will resume on the 1st of "
-                    f"next month, or upgrade your plan for more viewing time."
-                ),
-                headers={"Retry-After": "3600"},
-            )
+    # Every viewer of every camera shares this one event loop, and the
+    # ownership + viewer-cap checks are 3-4 synchronous SQLite round-trips
+    # per segment.  Run them on a worker thread so one viewer's DB work
+    # never stalls the segment bytes going out to everyone else — the
+    # serve itself below is just a dict lookup into the shared cache.
+    await asyncio.to_thread(
+        _authorize_segment_fetch, db, user.org_id, camera_id, filename
+    )
 
     cam_cache = _segment_cache.get(camera_id)
     if cam_cache:
@@ -597,7 +756,7 @@ async def get_hls_segment(
             return Response(
                 content=entry[0],
                 media_type="video/mp2t",
-                headers={"Cache-Control": "public, max-age=3600"},
+                headers=_SEGMENT_RESPONSE_HEADERS,
             )
 
     raise HTTPException(status_code=404, detail="Segment not found")
@@ -615,24 +774,7 @@ async def push_segment(
     Receive an HLS segment pushed by CloudNode.
     Stores in memory for the browser to fetch via GET /segment/{filename}.
     """
-    node_api_key = request.headers.get("X-Node-API-Key")
-    if not node_api_key:
-        raise HTTPException(status_code=401, detail="Missing API key")
-
-    api_key_hash = hashlib.sha256(node_api_key.encode()).hexdigest()
-    node = db.query(CameraNode).filter_by(api_key_hash=api_key_hash).first()
-    if not node:
-        raise HTTPException(status_code=401, detail="Invalid API key")
-
-    # Enforce both node ownership AND org match — defense-in-depth so a
-    # future schema drift can't let a node in org A touch a camera in org B.
-    camera = (
-        db.query(Camera)
-        .filter_by(camera_id=camera_id, node_id=node.id, org_id=node.org_id)
-        .first()
-    )
-    if not camera:
-        raise HTTPException(status_code=404, detail="Camera not found")
+    node, camera = _authenticate_node_push(request, db, camera_id)
 
     # Plan-cap enforcement. When the org is over its camera cap (downgrade
     # or cancellation), `enforce_camera_cap` has marked the over-cap
@@ -699,24 +841,7 @@ async def update_hls_playlist(
     Rewrites segment filenames to relative proxy URLs and caches the
     result so browser GET requests are served instantly.
     """
-    node_api_key = request.headers.get("X-Node-API-Key")
-    if not node_api_key:
-        raise HTTPException(status_code=401, detail="Missing API key")
-
-    api_key_hash = hashlib.sha256(node_api_key.encode()).hexdigest()
-    node = db.query(CameraNode).filter_by(api_key_hash=api_key_hash).first()
-    if not node:
-        raise HTTPException(status_code=401, detail="Invalid API key")
-
-    # Enforce both node ownership AND org match — defense-in-depth so a
-    # future schema drift can't let a node in org A touch a camera in org B.
-    camera = (
-        db.query(Camera)
-        .filter_by(camera_id=camera_id, node_id=node.id, org_id=node.org_id)
-        .first()
-    )
-    if not camera:
-        raise HTTPException(status_code=404, detail="Camera not found")
+    _authenticate_node_push(request, db, camera_id)
 
     body = await _read_capped_body(request, settings.PLAYLIST_PUSH_MAX_BYTES)
     try:
@@ -729,7 +854,7 @@ async def update_hls_playlist(
     # Pre-compute the rewritten playlist with proxy segment URLs
     # and cache it. Browser polls will serve this instantly.
     rewritten = _rewrite_playlist(playlist_content)
-    _playlist_cache[camera_id] = (rewritten, time.monotonic())
+    _playlist_cache[camera_id] = (rewritten.encode("utf-8"), time.monotonic())
 
     # First-push diagnostic log — capture the first raw segment URI so
     # we can see how FFmpeg is shaping it in production (bare basename
@@ -777,24 +902,7 @@ async def push_motion_event(
     Receive a motion detection event pushed by CloudNode via HTTP.
     This is a reliable fallback that works even when WebSocket is not connected.
     """
-    node_api_key = request.headers.get("X-Node-API-Key")
-    if not node_api_key:
-        raise HTTPException(status_code=401, detail="Missing API key")
-
-    api_key_hash = hashlib.sha256(node_api_key.encode()).hexdigest()
-    node = db.query(CameraNode).filter_by(api_key_hash=api_key_hash).first()
-    if not node:
-        raise HTTPException(status_code=401, detail="Invalid API key")
-
-    # Enforce both node ownership AND org match — defense-in-depth so a
-    # future schema drift can't let a node in org A touch a camera in org B.
-    camera = (
-        db.query(Camera)
-        .filter_by(camera_id=camera_id, node_id=node.id, org_id=node.org_id)
-        .first()
-    )
-    if not camera:
-        raise HTTPException(status_code=404, detail="Camera not found")
+    node, _camera = _authenticate_node_push(request, db, camera_id)
 
     # Per-org kill switch.  When an admin disables ingestion (e.g. a
     # misbehaving sensor is flooding events and you need a server-side
@@ -12,15 +12,19 @@ Reads are dashboard-only (admin) and live under `/api/incidents`.
 """
 
 import logging
+import sqlite3
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
 
 from app.core.auth import AuthUser, require_admin
-from app.core.database import get_db
+from app.core.database import engine, get_db
 from app.core.limiter import limiter
 from app.models.models import (
     INCIDENT_SEVERITIES,
@@ -309,6 +313,89 @@ async def delete_incident(
 # Evidence — fetch a snapshot blob
 # ---------------------------------------------------------------------------
 
+# Read size for streaming evidence blobs.  Clips are ~1-5 MB; 256 KB keeps
+# peak per-request memory at one chunk while staying well clear of
+# per-call overhead.
+_EVIDENCE_CHUNK_BYTES = 256 * 1024
+
+
+# Incremental blob I/O (``sqlite3.Connection.blobopen``) is a stdlib
+# sqlite3 feature.  On any other driver the route falls back to loading
+# the ``data`` column through the ORM and chunking it from memory.
+_EVIDENCE_BLOB_IO = engine.dialect.driver == "pysqlite"
+
+
+def _open_evidence_blob(evidence_id: int):
+    """Open an evidence blob for streaming via SQLite incremental blob I/O.
+    Returns ``(conn, blob)``, or ``None`` when the row is gone or its
+    ``data`` is NULL.
+
+    Uses its own connection rather than the request session:
+    StreamingResponse iterates the blob after the handler has returned,
+    so the ``get_db`` session may already be closed.  The handler takes
+    Content-Length from ``len(blob)`` on this same handle, so the header
+    always matches the bytes streamed.  ``incident_evidence.id`` is an
+    INTEGER PRIMARY KEY, i.e. the SQLite rowid blobopen wants.
+
+    The handle keeps a read transaction (and so a WAL snapshot) open
+    until it's closed — callers must release it via
+    ``_close_evidence_blob`` on every exit path, including a client
+    that disconnects halfway through.
+    """
+    conn = engine.raw_connection()
+    try:
+        blob = conn.driver_connection.blobopen(
+            "incident_evidence", "data", evidence_id, readonly=True
+        )
+    except sqlite3.Error:
+        # No such rowid, or a NULL / non-blob value in ``data``.
+        conn.close()
+        return None
+    except Exception:
+        conn.close()
+        raise
+    return conn, blob
+
+
+def _close_evidence_blob(conn, blob) -> None:
+    """Release a blob handle and its connection.  Both closes are
+    idempotent, so this is safe to call more than once."""
+    try:
+        blob.close()
+    finally:
+        conn.close()
+
+
+def _iter_evidence_blob(conn, blob) -> Iterator[bytes]:
+    """Yield an opened evidence blob in fixed-size chunks, releasing it
+    once exhausted.
+
+    The ``finally`` alone isn't enough on a disconnect: Starlette never
+    closes a sync body iterator, so it would only run once the
+    generator is garbage-collected.  The route also hands the same
+    close to the response's background task, which runs as soon as the
+    stream is cancelled.
+    """
+    try:
+        while chunk := blob.read(_EVIDENCE_CHUNK_BYTES):
+            yield chunk
+    finally:
+        _close_evidence_blob(conn, blob)
+
+
+def _evidence_media_type(raw_mime: Optional[str]) -> str:
+    """Strip any MIME parameters (we use video/mp2t;duration=N internally to
+    remember clip length without a schema migration — browsers don't need it)."""
+    raw_mime = raw_mime or "application/octet-stream"
+    return raw_mime.split(";", 1)[0].strip() or "application/octet-stream"
+
+
+def _iter_evidence_bytes(data: bytes) -> Iterator[bytes]:
+    """Chunk an in-memory blob (non-sqlite3 fallback path)."""
+    view = memoryview(data)
+    for start in range(0, len(view), _EVIDENCE_CHUNK_BYTES):
+        yield view[start:start + _EVIDENCE_CHUNK_BYTES]
+
 
 @router.get("/{incident_id}/evidence/{evidence_id}")
 @limiter.limit("120/minute")
@@ -331,26 +418,51 @@ async def get_incident_evidence(
     # Org check via the parent incident
     _get_owned_incident(db, user.org_id, incident_id)
 
-    evidence = (
-        db.query(IncidentEvidence)
-        .filter(
-            IncidentEvidence.id == evidence_id,
-            IncidentEvidence.incident_id == incident_id,
-        )
-        .first()
+    evidence_filter = (
+        IncidentEvidence.id == evidence_id,
+        IncidentEvidence.incident_id == incident_id,
     )
-    if not evidence or not evidence.data:
-        raise HTTPException(status_code=404, detail="Evidence blob not found")
 
-    # Strip any MIME parameters (we use video/mp2t;duration=N internally to
-    # remember clip length without a schema migration — browsers don't need it).
-    raw_mime = evidence.data_mime or "application/octet-stream"
-    media_type = raw_mime.split(";", 1)[0].strip() or "application/octet-stream"
+    if not _EVIDENCE_BLOB_IO:
+        row = db.query(IncidentEvidence.data_mime, IncidentEvidence.data).filter(
+            *evidence_filter
+        ).first()
+        if not row or not row.data:
+            raise HTTPException(status_code=404, detail="Evidence blob not found")
+        return StreamingResponse(
+            _iter_evidence_bytes(row.data),
+            media_type=_evidence_media_type(row.data_mime),
+            headers={
+                "Cache-Control": "private, max-age=300",
+                "Content-Length": str(len(row.data)),
+            },
+        )
 
-    return Response(
-        content=evidence.data,
-        media_type=media_type,
-        headers={"Cache-Control": "private, max-age=300"},
+    # Metadata only — the blob itself is streamed below straight out of
+    # SQLite, never materialised as one ``bytes`` object.
+    row = db.query(IncidentEvidence.data_mime).filter(*evidence_filter).first()
+    opened = _open_evidence_blob(evidence_id) if row else None
+    if opened is None:
+        raise HTTPException(status_code=404, detail="Evidence blob not found")
+    conn, blob = opened
+    size = len(blob)
+    if not size:
+        _close_evidence_blob(conn, blob)
+        raise HTTPException(status_code=404, detail="Evidence blob not found")
+
+    return StreamingResponse(
+        _iter_evidence_blob(conn, blob),
+        media_type=_evidence_media_type(row.data_mime),
+        headers={
+            "Cache-Control": "private, max-age=300",
+            # Known up front from the open blob handle, so clients get a
+            # real progress bar instead of chunked transfer encoding.
+            "Content-Length": str(size),
+        },
+        # Runs after the body completes AND after a client disconnect
+        # cancels the stream, so a slow or vanished client can't leave
+        # the connection and its read snapshot open.
+        background=BackgroundTask(_close_evidence_blob, conn, blob),
     )
 
 
@@ -383,7 +495,9 @@ async def get_incident_evidence_playlist(
         )
         .first()
     )
-    if not evidence or not evidence.data or evidence.kind != "clip":
+    # ``data_size`` is computed in SQL; the clip bytes stay in the DB —
+    # this endpoint only needs the MIME parameters.
+    if not evidence or not evidence.data_size or evidence.kind != "clip":
         raise HTTPException(status_code=404, detail="Clip not found")
 
     # Pull the duration parameter back out of the stored mime, falling back
@@ -31,6 +31,7 @@ disk.  A legitimate install hits each script exactly once.
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Request
@@ -103,8 +104,16 @@ def _pick_asset(release: dict, os_name: str, arch: str) -> str | None:
     return candidates[0].get("browser_download_url") or None
 
 
+@lru_cache(maxsize=None)
 def _read_script(filename: str) -> str:
-    """Read an install script from the scripts directory."""
+    """Read an install script from the scripts directory.
+
+    Cached for the life of the process: the scripts ship inside the
+    image and only change with a deploy, which restarts us anyway.
+    Without the cache every request did a blocking disk read on the
+    event loop.  Only ever called with the literal filenames below, so
+    the cache is bounded by the number of routes.
+    """
     script_path = SCRIPTS_DIR / filename
     return script_path.read_text(encoding="utf-8")
 
@@ -3,21 +3,23 @@ MCP API Key management endpoints.
 Users generate keys on the /mcp page; keys are stored hashed (SHA-256).
 """
 
-import hashlib
 import json
+import logging
 import secrets
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from app.core.audit import audit_label, write_audit
-from app.core.auth import AuthUser, require_active_billing, require_admin
+from app.core.auth import AuthUser, hash_api_key, require_active_billing, require_admin
 from app.core.database import get_db
 from app.core.limiter import limiter
 from app.mcp.server import MCP_ALL_TOOLS, MCP_READ_TOOLS, MCP_WRITE_TOOLS, mcp
 from app.models.models import McpApiKey
 from app.schemas.schemas import McpKeyCreate
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/mcp", tags=["mcp"])
 
 KEY_PREFIX = "osc_"
@@ -55,7 +57,7 @@ async def create_mcp_key(
         scope_tools = list(payload.scope_tools)
 
     raw_key = _generate_key()
-    key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+    key_hash = hash_api_key(raw_key)
 
     mcp_key = McpApiKey(
         org_id=user.org_id,
@@ -119,8 +121,7 @@ async def create_mcp_key(
         # Audit row already written above — losing the notification
         # email is annoying but not a security regression.  Don't
         # fail the API call.
-        import logging
-        logging.getLogger(__name__).exception(
+        logger.exception(
             "[McpKeys] notification emit failed for key_id=%s", mcp_key.id,
         )
 
@@ -247,8 +248,7 @@ async def revoke_mcp_key(
             db=db,
         )
     except Exception:
-        import logging
-        logging.getLogger(__name__).exception(
+        logger.exception(
             "[McpKeys] notification emit failed for revoke key_id=%s",
             mcp_key.id,
         )
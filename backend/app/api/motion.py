@@ -46,20 +46,34 @@ class MotionBroadcaster:
         self._subscribers: dict[str, list[asyncio.Queue]] = {}
 
     def notify(self, org_id: str, event_data: dict):
-        """Broadcast a motion event to all SSE subscribers for an org."""
-        queues = self._subscribers.get(org_id, [])
-        dead = []
-        for q in queues:
+        """Broadcast a motion event to all SSE subscribers for an org.
+
+        A subscriber that has fallen a full queue behind sheds its
+        OLDEST pending event to make room for this one.  Motion alerts
+        are a live feed — the newest events are the ones worth showing
+        — and the previous policy of dropping the subscriber outright
+        left its SSE generator parked on a queue nobody fed any more:
+        the dashboard kept receiving keepalives and never another
+        alert until the user reloaded.  Disconnected clients are still
+        removed by the generator's ``unsubscribe`` in its ``finally``.
+
+        The event is encoded into its SSE ``data:`` frame once, here,
+        and that string is what the queues carry — every open dashboard
+        tab used to re-run ``json.dumps`` on the same dict.  No
+        subscribers means no encoding at all.
+        """
+        subscribers = self._subscribers.get(org_id)
+        if not subscribers:
+            return
+        frame = f"data: {json.dumps(event_data)}\n\n"
+        for q in subscribers:
             try:
-                q.put_nowait(event_data)
+                q.put_nowait(frame)
             except asyncio.QueueFull:
-                dead.append(q)
-        if dead:
-            for q in dead:
-                try:
-                    self._subscribers[org_id].remove(q)
-                except (ValueError, KeyError):
-                    pass
+                # Single-threaded event loop: nothing can refill the
+                # slot between the get and the put.
+                q.get_nowait()
+                q.put_nowait(frame)
 
     def subscribe(self, org_id: str, cap: int = MAX_SSE_SUBSCRIBERS_PER_ORG) -> Optional[asyncio.Queue]:
         """Add a new SSE subscription for an org.
@@ -82,9 +96,10 @@ class MotionBroadcaster:
         return q
 
     def unsubscribe(self, org_id: str, q: asyncio.Queue):
-        if org_id in self._subscribers:
+        subscribers = self._subscribers.get(org_id)
+        if subscribers is not None:
             try:
-                self._subscribers[org_id].remove(q)
+                subscribers.remove(q)
             except ValueError:
                 pass
 
@@ -208,8 +223,8 @@ async def stream_motion_events(
 
             while True:
                 try:
-                    event = await asyncio.wait_for(queue.get(), timeout=25.0)
-                    yield f"data: {json.dumps(event)}\n\n"
+                    # Already a complete SSE frame — see ``notify``.
+                    yield await asyncio.wait_for(queue.get(), timeout=25.0)
                 except TimeoutError:
                     # Keepalive to prevent connection drop
                     yield ": keepalive\n\n"
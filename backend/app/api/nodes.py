@@ -1,4 +1,3 @@
-import hashlib
 import logging
 import uuid as uuid_mod
 from datetime import UTC, datetime
@@ -7,7 +6,13 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from app.core.audit import audit_label, write_audit
-from app.core.auth import AuthUser, get_current_user, require_active_billing, require_admin
+from app.core.auth import (
+    AuthUser,
+    get_current_user,
+    hash_api_key,
+    require_active_billing,
+    require_admin,
+)
 from app.core.codec import sanitize_video_codec
 from app.core.database import get_db
 from app.core.limiter import limiter
@@ -19,6 +24,7 @@ from app.core.plans import (
     get_plan_limits_for_org,
     wire_plan_slug,
 )
+from app.core.timezones import resolve_org_timezone
 from app.core.versions import check_node_version
 from app.models.models import Camera, CameraNode, Setting
 from app.schemas.schemas import NodeCreate, NodeHeartbeat, NodeRegister
@@ -219,7 +225,7 @@ async def validate_node(
     if not node:
         raise HTTPException(status_code=404, detail=f"Node '{node_id}' not found")
 
-    api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    api_key_hash = hash_api_key(api_key)
     if node.api_key_hash != api_key_hash:
         _record_node_register_error(
             db, node,
@@ -246,7 +252,7 @@ async def register_node(
         logger.warning("Registration rejected: no API key provided")
         raise HTTPException(status_code=401, detail="API key required")
 
-    api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    api_key_hash = hash_api_key(api_key)
 
     # Defensive sanitization — older CloudNode builds (v0.1.5 and earlier)
     # shipped garbage `avc1.*e00a` H.264 strings for the Pi's
@@ -273,8 +279,11 @@ async def register_node(
         # obvious.  Persisted on the node row so the dashboard can surface
         # the bad version even for nodes that get rejected here.
         version_check = check_node_version(data.node_version)
+        # One clock read for every timestamp this registration writes —
+        # node, codec and each camera row — so they all agree.
+        now = datetime.now(tz=UTC).replace(tzinfo=None)
         existing_node.node_version = version_check["parsed"] if data.node_version else None
-        existing_node.version_checked_at = datetime.now(tz=UTC).replace(tzinfo=None)
+        existing_node.version_checked_at = now
         if not version_check["supported"]:
             _record_node_register_error(
                 db, existing_node,
@@ -300,7 +309,7 @@ async def register_node(
         existing_node.local_ip = data.local_ip or existing_node.local_ip
         existing_node.http_port = data.http_port or existing_node.http_port
         existing_node.status = "online"
-        existing_node.last_seen = datetime.now(tz=UTC).replace(tzinfo=None)
+        existing_node.last_seen = now
         # Successful re-registration: clear any stale error from an
         # earlier bad-key attempt so the UI stops flagging it.
         existing_node.last_register_error = None
@@ -309,7 +318,7 @@ async def register_node(
         if data.video_codec:
             existing_node.video_codec = sanitized_video_codec
             existing_node.audio_codec = data.audio_codec
-            existing_node.codec_detected_at = datetime.now(tz=UTC).replace(tzinfo=None)
+            existing_node.codec_detected_at = now
 
         # Enforce camera cap: count existing org cameras vs plan limit
         org_id = existing_node.org_id
@@ -342,7 +351,7 @@ async def register_node(
             if existing_cam:
                 logger.debug("Updating existing camera %s", camera_id)
                 existing_cam.name = cam_data.name or existing_cam.name
-                existing_cam.last_seen = datetime.now(tz=UTC).replace(tzinfo=None)
+                existing_cam.last_seen = now
                 existing_cam.status = "online"
                 if data.video_codec:
                     existing_cam.video_codec = sanitized_video_codec
@@ -369,10 +378,10 @@ async def register_node(
                     if cam_data.capabilities
                     else "streaming",
                     status="online",
-                    last_seen=datetime.now(tz=UTC).replace(tzinfo=None),
+                    last_seen=now,
                     video_codec=sanitized_video_codec,
                     audio_codec=data.audio_codec,
-                    codec_detected_at=datetime.now(tz=UTC).replace(tzinfo=None) if data.video_codec else None,
+                    codec_detected_at=now if data.video_codec else None,
                 )
                 db.add(new_cam)
                 new_camera_count += 1
@@ -461,7 +470,7 @@ async def node_heartbeat(
         logger.warning("Heartbeat rejected: no API key provided for node %s", data.node_id)
         raise HTTPException(status_code=401, detail="API key required")
 
-    api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    api_key_hash = hash_api_key(api_key)
     node = db.query(CameraNode).filter_by(node_id=data.node_id).first()
 
     if not node:
@@ -477,8 +486,9 @@ async def node_heartbeat(
     # version on every heartbeat so the dashboard reflects in-place updates
     # without requiring a re-register.
     version_check = check_node_version(data.node_version)
+    now = datetime.now(tz=UTC).replace(tzinfo=None)
     node.node_version = version_check["parsed"] if data.node_version else None
-    node.version_checked_at = datetime.now(tz=UTC).replace(tzinfo=None)
+    node.version_checked_at = now
     if not version_check["supported"]:
         raise HTTPException(
             status_code=426,
@@ -495,7 +505,7 @@ async def node_heartbeat(
         )
 
     node.status = "online"
-    node.last_seen = datetime.now(tz=UTC).replace(tzinfo=None)
+    node.last_seen = now
     node.local_ip = data.local_ip or node.local_ip
 
     # Persist filesystem-aware storage stats from CloudNode v0.1.41+.
@@ -535,22 +545,43 @@ async def node_heartbeat(
             Camera.node_id == node.id,
         ).all()
         cam_map = {c.camera_id: c for c in cams}
-        now = datetime.now(tz=UTC).replace(tzinfo=None)
+        unchanged_ids: list[int] = []
         for cam_status in camera_updates:
             cam = cam_map.get(cam_status.camera_id)
-            if cam:
-                cam.status = cam_status.status
-                cam.last_seen = now
-                # Record (or clear) the pipeline failure reason. Healthy
-                # states wipe the field so stale errors don't linger in
-                # the API response after the supervisor recovers.
-                if cam_status.status in ("restarting", "failed", "error"):
-                    cam.last_error = cam_status.last_error
-                else:
-                    cam.last_error = None
+            if not cam:
+                continue
+            # Record (or clear) the pipeline failure reason. Healthy
+            # states wipe the field so stale errors don't linger in
+            # the API response after the supervisor recovers.
+            if cam_status.status in ("restarting", "failed", "error"):
+                new_error = cam_status.last_error
+            else:
+                new_error = None
+            if cam.status == cam_status.status and cam.last_error == new_error:
+                unchanged_ids.append(cam.id)
+                continue
+            cam.status = cam_status.status
+            cam.last_seen = now
+            cam.last_error = new_error
+        # Same steady-state shortcut as the WebSocket heartbeat: cameras
+        # whose status didn't change only need last_seen bumped, which
+        # is one bulk UPDATE rather than a per-row flush.
+        if unchanged_ids:
+            db.query(Camera).filter(Camera.id.in_(unchanged_ids)).update(
+                {Camera.last_seen: now}, synchronize_session=False,
+            )
 
     db.commit()
 
+    # Every org-level Setting the rest of the heartbeat needs, in one
+    # query rather than a round trip per key — this runs ~every 30s for
+    # every node in the fleet.
+    org_settings = Setting.get_many(db, node.org_id, {
+        "payment_past_due": "false",
+        "org_plan": "free_org",
+        "timezone": "UTC",
+    })
+
     # Past-due grace sweep. Webhooks cover plan-change events, but the
     # *time-based* transition from "in grace" to "past grace" has no
     # corresponding webhook — we have to check periodically. Heartbeats
@@ -558,7 +589,7 @@ async def node_heartbeat(
     # org is actually past-due, so the happy path pays zero cost. The
     # helper is idempotent so once the flags stabilize, subsequent
     # heartbeats are UPDATE-0-rows.
-    if Setting.get(db, node.org_id, "payment_past_due", "false") == "true":
+    if org_settings["payment_past_due"] == "true":
         from app.core.plans import enforce_camera_cap
         try:
             enforce_camera_cap(db, node.org_id)
@@ -576,7 +607,7 @@ async def node_heartbeat(
     # heartbeats fire every ~30s per node, and resolve_org_plan talks to
     # Clerk for free/missing plans. The Setting is authoritative within a
     # few seconds of a plan change and advisory on the node anyway.
-    cached_plan = Setting.get(db, node.org_id, "org_plan", "free_org") or "free_org"
+    cached_plan = org_settings["org_plan"] or "free_org"
 
     # Pull every camera on this node so we can compute both the
     # disabled-by-plan list AND the recording-state map in one query.
@@ -603,14 +634,14 @@ async def node_heartbeat(
     # and the lookup is a Setting.get behind a Python dict.  Default
     # is UTC for orgs that haven't explicitly set one (matches v0.1.43
     # behaviour so existing schedules don't shift on upgrade).
-    tz = _resolve_org_timezone(db, node.org_id)
+    tz = resolve_org_timezone(node.org_id, org_settings["timezone"])
     recording_state = {
         c.camera_id: _camera_should_record_now(c, tz) for c in node_cameras
     }
 
     response = {
         "success": True,
-        "timestamp": datetime.now(tz=UTC).replace(tzinfo=None).isoformat(),
+        "timestamp": now.isoformat(),
         "plan": wire_plan_slug(cached_plan),
         "disabled_cameras": disabled_cameras,
         "recording_state": recording_state,
@@ -620,28 +651,6 @@ async def node_heartbeat(
     return response
 
 
-def _resolve_org_timezone(db: Session, org_id: str):
-    """Return the IANA ``ZoneInfo`` for the org, defaulting to UTC.
-
-    Stored as a Setting row keyed on ``timezone``.  Validated at the
-    PATCH endpoint, but we still defend against bad strings here
-    (operator could hand-edit the DB, or the row could pre-date a
-    tighter validator) by falling back to UTC rather than raising
-    out of the heartbeat handler — an error here would 500 every
-    heartbeat for the affected org and stop their recording entirely.
-    """
-    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
-    tz_name = Setting.get(db, org_id, "timezone", "UTC") or "UTC"
-    try:
-        return ZoneInfo(tz_name)
-    except (ZoneInfoNotFoundError, ValueError):
-        logger.warning(
-            "Org %s has invalid timezone setting %r — falling back to UTC",
-            org_id, tz_name,
-        )
-        return ZoneInfo("UTC")
-
-
 def _camera_should_record_now(camera: Camera, tz) -> bool:
     """Return True if `camera` should be recording right now per its
     saved policy.
@@ -812,7 +821,7 @@ async def create_node(
 
     node_id = str(uuid_mod.uuid4())[:8]
     api_key = str(uuid_mod.uuid4())
-    api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    api_key_hash = hash_api_key(api_key)
 
     node = CameraNode(
         node_id=node_id,
@@ -889,7 +898,7 @@ async def decommission_self(
     if not api_key:
         raise HTTPException(status_code=401, detail="API key required")
 
-    api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    api_key_hash = hash_api_key(api_key)
     node = db.query(CameraNode).filter_by(api_key_hash=api_key_hash).first()
     if not node:
         raise HTTPException(status_code=404, detail="Node not found")
@@ -1005,7 +1014,7 @@ async def rotate_api_key(
         raise HTTPException(status_code=404, detail="Node not found")
 
     new_api_key = str(uuid_mod.uuid4())
-    node.api_key_hash = hashlib.sha256(new_api_key.encode()).hexdigest()
+    node.api_key_hash = hash_api_key(new_api_key)
     node.key_rotated_at = datetime.now(tz=UTC).replace(tzinfo=None)
     db.commit()
 
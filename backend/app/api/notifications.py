@@ -409,6 +409,9 @@ def _enqueue_email_for_notification(
                 pass
             return 0
 
+        from app.core.email_worker import wake_email_worker
+        wake_email_worker()
+
     return enqueued
 
 logger = logging.getLogger(__name__)
@@ -439,15 +442,22 @@ class NotificationBroadcaster:
 
         Subscribers get the event only if their role matches the event's
         audience ("all" is delivered to everyone; "admin" only to admins).
+
+        Queues carry the pre-encoded SSE frame, built once on first
+        delivery rather than once per subscriber in each stream's
+        generator.
         """
         audience = event_data.get("audience", "all")
         subs = self._subscribers.get(org_id, [])
         dead = []
+        frame = None
         for q, is_admin in subs:
             if audience == "admin" and not is_admin:
                 continue
+            if frame is None:
+                frame = f"data: {json.dumps(event_data)}\n\n"
             try:
-                q.put_nowait(event_data)
+                q.put_nowait(frame)
             except asyncio.QueueFull:
                 dead.append((q, is_admin))
         if dead:
@@ -1003,8 +1013,8 @@ async def stream_notifications(
             yield f"data: {json.dumps({'type': 'connected', 'org_id': org_id})}\n\n"
             while True:
                 try:
-                    event = await asyncio.wait_for(queue.get(), timeout=25.0)
-                    yield f"data: {json.dumps(event)}\n\n"
+                    # Already a complete SSE frame — see ``notify``.
+                    yield await asyncio.wait_for(queue.get(), timeout=25.0)
                 except TimeoutError:
                     yield ": keepalive\n\n"
         except asyncio.CancelledError:
@@ -47,6 +47,7 @@ from app.core.sentinel_dispatch import (
     dispatch_manual_run,
     runs_used_this_month,
 )
+from app.core.timezones import resolve_org_timezone
 from app.models.models import Incident, SentinelConfig, SentinelRun, Setting
 
 logger = logging.getLogger(__name__)
@@ -135,14 +136,22 @@ async def require_sentinel_agent(
     string), which is the desired behaviour in environments where
     the agent isn't deployed.
     """
-    if not settings.SENTINEL_AGENT_KEY:
+    expected = settings.SENTINEL_AGENT_KEY
+    if not expected:
         raise HTTPException(401, "agent auth not configured")
     # Constant-time compare so a timing side-channel can't reveal
-    # prefix matches against the configured secret.  Empty header
-    # short-circuits before the compare (compare_digest on length-zero
-    # is False but raises on type mismatch in some Python builds).
-    if not x_sentinel_agent_key or not hmac.compare_digest(
-        x_sentinel_agent_key, settings.SENTINEL_AGENT_KEY
+    # prefix matches against the configured secret.  Empty or
+    # wrong-length headers short-circuit before the compare — the
+    # key's length isn't secret, and it saves the digest walk on the
+    # obvious junk.  Compared as bytes: compare_digest raises TypeError
+    # on non-ASCII ``str`` (header values are latin-1 decoded, so a
+    # stray high byte would otherwise surface as a 500, not a 401).
+    if (
+        not x_sentinel_agent_key
+        or len(x_sentinel_agent_key) != len(expected)
+        or not hmac.compare_digest(
+            x_sentinel_agent_key.encode("utf-8"), expected.encode("utf-8")
+        )
     ):
         raise HTTPException(401, "invalid agent key")
 
@@ -299,12 +308,9 @@ async def list_runs(
     # non-UTC org (an EU user at 06:00 local would miss the six
     # hours of runs that landed between 23:00 UTC and 05:00 UTC
     # before the UTC day rolled).
-    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
-    tz_name = Setting.get(db, user.org_id, "timezone", "UTC") or "UTC"
-    try:
-        org_tz = ZoneInfo(tz_name)
-    except (ZoneInfoNotFoundError, ValueError):
-        org_tz = ZoneInfo("UTC")
+    org_tz = resolve_org_timezone(
+        user.org_id, Setting.get(db, user.org_id, "timezone", "UTC"),
+    )
     now_local = datetime.now(tz=org_tz)
     today_start = (
         now_local.replace(hour=0, minute=0, second=0, microsecond=0)
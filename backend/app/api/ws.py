@@ -18,7 +18,6 @@ Backend → Node types:
 """
 
 import asyncio
-import hashlib
 import logging
 import time
 import uuid
@@ -29,9 +28,10 @@ from typing import Optional
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
+from app.core.auth import hash_api_key
 from app.core.database import SessionLocal
 from app.core.versions import check_node_version
-from app.models import Camera, CameraNode, MotionEvent
+from app.models import Camera, CameraNode, MotionEvent, Setting
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +117,10 @@ class ConnectionManager:
         self._connections: dict[str, WebSocket] = {}
         # Pending command futures: {correlation_id: (node_id, asyncio.Future)}
         self._pending_commands: dict[str, tuple[str, asyncio.Future]] = {}
+        # Reverse index {node_id: {correlation_id, ...}} so disconnect()
+        # finds a node's in-flight commands without scanning every
+        # pending command across the fleet.
+        self._pending_by_node: dict[str, set[str]] = {}
 
     @property
     def connected_nodes(self) -> list[str]:
@@ -134,19 +138,23 @@ class ConnectionManager:
             except Exception:
                 pass
         self._connections[node_id] = ws
-        # Use print() so it always appears in fly logs (logger.info is filtered by default)
-        print(f"[WS] Node {node_id} connected via WebSocket")
+        # Through the logger rather than print(): configure_logging sets
+        # the root to INFO and hands records to a listener thread, so a
+        # reconnect storm doesn't block the event loop on stdout writes.
+        logger.info("[WS] Node %s connected via WebSocket", node_id)
 
     def disconnect(self, node_id: str):
         self._connections.pop(node_id, None)
         # Cancel pending command futures so callers don't wait until
         # timeout for a node that's already gone.
-        stale = [cid for cid, (nid, _) in self._pending_commands.items() if nid == node_id]
-        for cid in stale:
-            _, future = self._pending_commands.pop(cid)
+        for cid in self._pending_by_node.pop(node_id, ()):
+            entry = self._pending_commands.pop(cid, None)
+            if entry is None:
+                continue
+            _, future = entry
             if not future.done():
                 future.cancel()
-        print(f"[WS] Node {node_id} disconnected from WebSocket")
+        logger.info("[WS] Node %s disconnected from WebSocket", node_id)
 
     async def send_command(
         self,
@@ -166,6 +174,7 @@ class ConnectionManager:
         correlation_id = str(uuid.uuid4())
         future: asyncio.Future = asyncio.get_running_loop().create_future()
         self._pending_commands[correlation_id] = (node_id, future)
+        self._pending_by_node.setdefault(node_id, set()).add(correlation_id)
 
         try:
             await ws.send_json({
@@ -181,6 +190,11 @@ class ConnectionManager:
             raise ValueError(f"Node {node_id} disconnected while awaiting {command}") from None
         finally:
             self._pending_commands.pop(correlation_id, None)
+            node_pending = self._pending_by_node.get(node_id)
+            if node_pending is not None:
+                node_pending.discard(correlation_id)
+                if not node_pending:
+                    del self._pending_by_node[node_id]
 
     def resolve_command(self, correlation_id: str, result: dict):
         """Called when a command_result message arrives from a node."""
@@ -222,13 +236,15 @@ async def node_websocket(
         return
 
     # --- Authenticate ---
-    api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    api_key_hash = hash_api_key(api_key)
 
     db: Session = SessionLocal()
     try:
         node = db.query(CameraNode).filter_by(node_id=node_id).first()
         if not node or node.api_key_hash != api_key_hash:
-            print(f"[WS] Auth failed for node_id={node_id} (found={node is not None})")
+            logger.warning(
+                "[WS] Auth failed for node_id=%s (found=%s)", node_id, node is not None,
+            )
             await ws.close(code=4001, reason="Invalid node_id or API key")
             return
         org_id = node.org_id
@@ -263,47 +279,18 @@ async def node_websocket(
                 continue
 
             msg_type = data.get("type")
-
-            if msg_type == "heartbeat":
-                hb_result = await _handle_heartbeat(node_id, node_db_id, org_id, data.get("payload", {}))
-                # Pass version-compat hints back through the ack so CloudNode
-                # can log "update available" or "you're below the supported
-                # floor" without needing a separate channel.  Keys are
-                # omitted when there's nothing to say (no update, supported)
-                # so old nodes that don't parse the new fields stay happy.
-                ack_payload = {
-                    "timestamp": datetime.now(tz=UTC).replace(tzinfo=None).isoformat(),
-                }
-                if hb_result and hb_result.get("update_available"):
-                    ack_payload["update_available"] = hb_result["update_available"]
-                if hb_result and hb_result.get("unsupported"):
-                    ack_payload["unsupported"] = True
-                await ws.send_json({
-                    "type": "ack",
-                    "id": data.get("id"),
-                    "payload": ack_payload,
-                })
-
-            elif msg_type == "command_result":
-                correlation_id = data.get("id")
-                if correlation_id:
-                    manager.resolve_command(correlation_id, data.get("payload", {}))
-
-            elif msg_type == "event":
-                command = data.get("command")
-                payload = data.get("payload", {})
-                if command == "motion_detected":
-                    await _handle_motion_event(node_id, org_id, payload)
-                else:
-                    logger.debug("Unhandled event command from node %s: %s", node_id, command)
-
-            else:
+            # A list/dict "type" is unhashable — check before the lookup so
+            # it gets the unknown-type reply instead of dropping the socket.
+            handler = _MESSAGE_HANDLERS.get(msg_type) if isinstance(msg_type, str) else None
+            if handler is None:
                 logger.warning("Unknown WS message type from node %s: %s", node_id, msg_type)
                 await ws.send_json({
                     "type": "error",
                     "id": data.get("id"),
                     "payload": {"detail": f"Unknown message type: {msg_type}"},
                 })
+                continue
+            await handler(ws, node_id, node_db_id, org_id, data)
 
     except WebSocketDisconnect:
         pass
@@ -348,14 +335,16 @@ async def _handle_heartbeat(node_id: str, node_db_id: int, org_id: str, payload:
 
         reported_version = payload.get("node_version")
         version_check = check_node_version(reported_version)
+        # One clock read for the node row and every camera row below.
+        now = datetime.now(tz=UTC).replace(tzinfo=None)
         node.node_version = version_check["parsed"] if reported_version else None
-        node.version_checked_at = datetime.now(tz=UTC).replace(tzinfo=None)
+        node.version_checked_at = now
         response["update_available"] = version_check["update_available"]
         response["unsupported"] = not version_check["supported"]
 
         prev_node_status = node.status
         node.status = "online"
-        node.last_seen = datetime.now(tz=UTC).replace(tzinfo=None)
+        node.last_seen = now
 
         if prev_node_status != "online":
             transitions.append(("node", node.node_id, node.name or node.node_id, "online", None))
@@ -373,29 +362,42 @@ async def _handle_heartbeat(node_id: str, node_db_id: int, org_id: str, payload:
                     Camera.node_id == node_db_id,
                 ).all()
                 cam_map = {c.camera_id: c for c in cams}
-                now = datetime.now(tz=UTC).replace(tzinfo=None)
+                unchanged_ids: list[int] = []
                 for cam_data in cameras:
                     cam = cam_map.get(cam_data.get("camera_id"))
-                    if cam:
-                        prev_cam_status = cam.status
-                        new_cam_status = cam_data.get("status", "online")
-                        cam.status = new_cam_status
-                        cam.last_seen = now
-                        # Record (or clear) the pipeline failure reason.
-                        # Healthy states wipe the field so stale errors
-                        # don't linger once the supervisor recovers.
-                        if new_cam_status in ("restarting", "failed", "error"):
-                            cam.last_error = cam_data.get("last_error")
-                        else:
-                            cam.last_error = None
-                        if (
-                            prev_cam_status != new_cam_status
-                            and new_cam_status in ("online", "offline")
-                        ):
-                            display = cam.name or cam.camera_id
-                            transitions.append(
-                                ("camera", cam.camera_id, display, new_cam_status, node_id)
-                            )
+                    if not cam:
+                        continue
+                    prev_cam_status = cam.status
+                    new_cam_status = cam_data.get("status", "online")
+                    # Record (or clear) the pipeline failure reason.
+                    # Healthy states wipe the field so stale errors
+                    # don't linger once the supervisor recovers.
+                    if new_cam_status in ("restarting", "failed", "error"):
+                        new_error = cam_data.get("last_error")
+                    else:
+                        new_error = None
+                    if prev_cam_status == new_cam_status and cam.last_error == new_error:
+                        unchanged_ids.append(cam.id)
+                        continue
+                    cam.status = new_cam_status
+                    cam.last_seen = now
+                    cam.last_error = new_error
+                    if (
+                        prev_cam_status != new_cam_status
+                        and new_cam_status in ("online", "offline")
+                    ):
+                        display = cam.name or cam.camera_id
+                        transitions.append(
+                            ("camera", cam.camera_id, display, new_cam_status, node_id)
+                        )
+                # Steady state is every camera re-reporting the status it
+                # already has — only last_seen moves.  Bump those in one
+                # UPDATE ... WHERE id IN (...) instead of dirtying each
+                # row and having the flush write them one by one.
+                if unchanged_ids:
+                    db.query(Camera).filter(Camera.id.in_(unchanged_ids)).update(
+                        {Camera.last_seen: now}, synchronize_session=False,
+                    )
 
         db.commit()
     except Exception as e:
@@ -468,6 +470,8 @@ async def _handle_motion_event(node_id: str, org_id: str, payload: dict):
             logger.debug("Unparseable timestamp from node %s, using server time", node_id)
     if ts is None:
         ts = datetime.now(tz=UTC).replace(tzinfo=None)
+    # Formatted once for both the SSE payload and the notification meta.
+    ts_iso = ts.isoformat()
 
     try:
         seq = int(segment_seq) if segment_seq is not None else None
@@ -482,31 +486,43 @@ async def _handle_motion_event(node_id: str, org_id: str, payload: dict):
         # motion events referencing camera IDs it doesn't own (or that
         # don't exist).  Cross-tenant is still blocked because org_id
         # comes from the auth'd session, not the payload.
-        from app.models.models import Camera as _Camera
-        from app.models.models import CameraNode as _CameraNode
-
-        owning_node = (
-            db.query(_CameraNode)
-            .filter_by(node_id=node_id, org_id=org_id)
-            .first()
-        )
-        if not owning_node:
-            logger.warning(
-                "Motion event rejected: node %s not found in org %s", node_id, org_id,
-            )
-            return
+        #
+        # One joined lookup on the happy path (same shape as the HLS push
+        # auth) instead of a node query followed by a camera query for
+        # every event; the node-only query runs just to word the
+        # rejection log line.
         cam_row = (
-            db.query(_Camera)
-            .filter_by(camera_id=camera_id, node_id=owning_node.id, org_id=org_id)
+            db.query(Camera)
+            .join(CameraNode, Camera.node_id == CameraNode.id)
+            .filter(
+                Camera.camera_id == camera_id,
+                Camera.org_id == org_id,
+                CameraNode.node_id == node_id,
+                CameraNode.org_id == org_id,
+            )
             .first()
         )
         if not cam_row:
-            logger.warning(
-                "Motion event rejected: camera %s not owned by node %s (org %s)",
-                camera_id, node_id, org_id,
+            node_known = (
+                db.query(CameraNode.id)
+                .filter_by(node_id=node_id, org_id=org_id)
+                .first()
             )
+            if not node_known:
+                logger.warning(
+                    "Motion event rejected: node %s not found in org %s", node_id, org_id,
+                )
+            else:
+                logger.warning(
+                    "Motion event rejected: camera %s not owned by node %s (org %s)",
+                    camera_id, node_id, org_id,
+                )
             return
 
+        # Read the friendly name off the ownership row now — the commit
+        # below expires it, and touching it afterwards would reload it.
+        display_name = cam_row.name or camera_id
+
         event = MotionEvent(
             org_id=org_id,
             camera_id=camera_id,
@@ -531,23 +547,15 @@ async def _handle_motion_event(node_id: str, org_id: str, payload: dict):
             "camera_id": camera_id,
             "node_id": node_id,
             "score": score_int,
-            "timestamp": ts.isoformat(),
+            "timestamp": ts_iso,
         })
 
 
         # Also emit an inbox notification so the user can see motion
-        # history in the bell panel.  Resolve the camera name for a
-        # friendlier title — fall back to the camera_id if not found.
+        # history in the bell panel.  The title uses the camera name
+        # captured from the ownership lookup above (camera_id if unnamed).
         try:
             from app.api.notifications import create_notification
-            from app.models.models import Camera
-
-            cam = (
-                db.query(Camera)
-                .filter_by(camera_id=camera_id, org_id=org_id)
-                .first()
-            )
-            display_name = cam.name if cam and cam.name else camera_id
 
             create_notification(
                 org_id=org_id,
@@ -562,7 +570,7 @@ async def _handle_motion_event(node_id: str, org_id: str, payload: dict):
                 meta={
                     "score": score_int,
                     "segment_seq": seq,
-                    "event_timestamp": ts.isoformat(),
+                    "event_timestamp": ts_iso,
                 },
                 db=db,
             )
@@ -574,3 +582,82 @@ async def _handle_motion_event(node_id: str, org_id: str, payload: dict):
         db.rollback()
     finally:
         db.close()
+
+
+# ── Message Dispatch ─────────────────────────────────────────────────
+# One handler per node → backend message type, looked up once per
+# message instead of walking an if/elif chain.  Every handler takes the
+# same (ws, node_id, node_db_id, org_id, data) arguments so the receive
+# loop stays a single dict lookup + await; adding a message type is a
+# new function and a new table entry.
+
+async def _on_heartbeat(
+    ws: WebSocket, node_id: str, node_db_id: int, org_id: str, data: dict,
+) -> None:
+    hb_result = await _handle_heartbeat(node_id, node_db_id, org_id, data.get("payload", {}))
+    # Pass version-compat hints back through the ack so CloudNode
+    # can log "update available" or "you're below the supported
+    # floor" without needing a separate channel.  Keys are
+    # omitted when there's nothing to say (no update, supported)
+    # so old nodes that don't parse the new fields stay happy.
+    ack_payload = {
+        "timestamp": datetime.now(tz=UTC).replace(tzinfo=None).isoformat(),
+    }
+    if hb_result and hb_result.get("update_available"):
+        ack_payload["update_available"] = hb_result["update_available"]
+    if hb_result and hb_result.get("unsupported"):
+        ack_payload["unsupported"] = True
+    await ws.send_json({
+        "type": "ack",
+        "id": data.get("id"),
+        "payload": ack_payload,
+    })
+
+
+async def _on_command_result(
+    ws: WebSocket, node_id: str, node_db_id: int, org_id: str, data: dict,
+) -> None:
+    correlation_id = data.get("id")
+    if correlation_id:
+        manager.resolve_command(correlation_id, data.get("payload", {}))
+
+
+async def _on_event(
+    ws: WebSocket, node_id: str, node_db_id: int, org_id: str, data: dict,
+) -> None:
+    command = data.get("command")
+    handler = _EVENT_HANDLERS.get(command) if isinstance(command, str) else None
+    if handler is None:
+        logger.debug("Unhandled event command from node %s: %s", node_id, command)
+        return
+    await handler(node_id, org_id, data.get("payload", {}))
+
+
+async def _on_motion_detected(node_id: str, org_id: str, payload: dict) -> None:
+    """WS entry for ``motion_detected`` — checks the per-org ingestion
+    kill switch before any payload validation, ownership join or insert.
+
+    The HTTP ``POST /motion`` fallback already makes this check before
+    it even parses the request body; the WebSocket path skipped it, so
+    an org that had switched ingestion off still paid the full per-event
+    cost (and still got the events) from any node connected over WS.
+    """
+    db: Session = SessionLocal()
+    try:
+        enabled = Setting.get(db, org_id, "motion_ingestion_enabled", "true").lower() == "true"
+    finally:
+        db.close()
+    if not enabled:
+        return
+    await _handle_motion_event(node_id, org_id, payload)
+
+
+_EVENT_HANDLERS = {
+    "motion_detected": _on_motion_detected,
+}
+
+_MESSAGE_HANDLERS = {
+    "heartbeat": _on_heartbeat,
+    "command_result": _on_command_result,
+    "event": _on_event,
+}
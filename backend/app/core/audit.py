@@ -25,9 +25,13 @@ logger = logging.getLogger(__name__)
 
 
 def _client_ip(request: Optional[Request]) -> str:
-    if request is None or request.client is None:
+    # Read the ASGI ``client`` tuple directly: ``request.client`` builds
+    # a fresh Address namedtuple on every access, and the old code
+    # touched it twice per audit row.
+    if request is None:
         return ""
-    return request.client.host or ""
+    client = request.scope.get("client")
+    return (client[0] or "") if client else ""
 
 
 def write_audit(
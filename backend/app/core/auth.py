@@ -1,3 +1,7 @@
+import hashlib
+import logging
+from functools import cached_property, lru_cache
+
 import httpx
 from clerk_backend_api.security import AuthenticateRequestOptions
 from fastapi import Depends, HTTPException, Request, status
@@ -7,6 +11,8 @@ from app.core.clerk import clerk
 from app.core.config import settings
 from app.core.database import get_db
 
+logger = logging.getLogger(__name__)
+
 
 class AuthUser:
     def __init__(
@@ -33,7 +39,12 @@ class AuthUser:
     def has_permission(self, permission: str) -> bool:
         return permission in self.org_permissions
 
-    @property
+    # Claims are fixed for the life of the request, so the role decision
+    # is computed once on first access.  require_admin, the notification
+    # audience filter and the SSE subscribe path all consult it per
+    # request; caching keeps repeat checks to an attribute lookup
+    # instead of re-scanning the permission list.
+    @cached_property
     def is_admin(self) -> bool:
         return self.org_role in ("org:admin", "admin") or self.has_permission(
             "org:cameras:manage_cameras"
@@ -60,6 +71,19 @@ def decode_v2_permissions(claims: dict) -> list:
     if not per_str:
         return []
 
+    return list(_decode_permission_bitmap(per_str, fea_claim, o_claim.get("fpm", "")))
+
+
+@lru_cache(maxsize=128)
+def _decode_permission_bitmap(per_str: str, fea_claim: str, fpm_str: str) -> tuple[str, ...]:
+    """Expand the V2 ``per`` / ``fea`` / ``fpm`` claim strings into
+    ``org:{feature}:{permission}`` keys.
+
+    Every member of an org with the same role and plan carries the exact
+    same three strings, so the split-and-bit-test pass is memoised on
+    them rather than redone on every authenticated request.  Returns a
+    tuple so cached results can't be mutated by a caller.
+    """
     permission_names = per_str.split(",")
 
     # Get features from fea (strip 'o:' prefix)
@@ -71,7 +95,6 @@ def decode_v2_permissions(claims: dict) -> list:
             features.append(f)
 
     # Get feature-permission map from o.fpm
-    fpm_str = o_claim.get("fpm", "")
     fpm_values = []
     if fpm_str:
         try:
@@ -89,7 +112,20 @@ def decode_v2_permissions(claims: dict) -> list:
                 if fpm_value & (1 << j):
                     permissions.append(f"org:{feature}:{perm_name}")
 
-    return permissions
+    return tuple(permissions)
+
+
+def hash_api_key(api_key: str) -> str:
+    """SHA-256 hex digest of a node or MCP API key, as stored in
+    ``api_key_hash`` / ``key_hash``.
+
+    One helper for every site that mints or looks up a key, so the
+    derivation can't drift between them.  Deliberately not cached: a
+    memo table would keep plaintext bearer secrets (including
+    attacker-supplied junk keys) resident in process memory to save a
+    microsecond of hashing.
+    """
+    return hashlib.sha256(api_key.encode()).hexdigest()
 
 
 def convert_to_httpx_request(fastapi_request: Request) -> httpx.Request:
@@ -100,6 +136,17 @@ def convert_to_httpx_request(fastapi_request: Request) -> httpx.Request:
     )
 
 
+@lru_cache(maxsize=1)
+def _authenticate_options(frontend_url: str) -> AuthenticateRequestOptions:
+    """Clerk verification options, built once per process.
+
+    Every authenticated request needs the same options object, so
+    rebuilding the dataclass (and its list) per call was pure churn.
+    Keyed on the URL so a settings change still takes effect.
+    """
+    return AuthenticateRequestOptions(authorized_parties=[frontend_url])
+
+
 async def get_current_user(request: Request) -> AuthUser:
     if not settings.is_clerk_configured():
         raise HTTPException(
@@ -112,7 +159,7 @@ async def get_current_user(request: Request) -> AuthUser:
     try:
         request_state = clerk.authenticate_request(
             httpx_request,
-            AuthenticateRequestOptions(authorized_parties=[settings.FRONTEND_URL]),
+            _authenticate_options(settings.FRONTEND_URL),
         )
 
         if not request_state.is_signed_in:
@@ -133,7 +180,7 @@ async def get_current_user(request: Request) -> AuthUser:
 
         # Extract active plan from V2 JWT (e.g. "o:pro" -> "pro")
         plan_claim = claims.get("pla", "")
-        active_plan = plan_claim.split(":")[-1] if plan_claim else "free_org"
+        active_plan = plan_claim.rpartition(":")[2] if plan_claim else "free_org"
 
         # Extract active features from fea claim
         fea_claim = claims.get("fea", "")
@@ -203,8 +250,7 @@ async def get_current_user(request: Request) -> AuthUser:
     except HTTPException:
         raise
     except Exception:
-        import logging
-        logging.getLogger(__name__).error("Authentication failed", exc_info=True)
+        logger.error("Authentication failed", exc_info=True)
         # Don't leak the underlying auth-internal error in the chain — the log
         # line above already captured it for operators; clients only see 401.
         raise HTTPException(
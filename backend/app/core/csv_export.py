@@ -7,9 +7,9 @@ Why this exists in its own module:
     streaming pattern, shared response headers.  Without this module
     each endpoint would copy-paste 30 lines and they'd drift.
   - Streaming matters: org with 50k audit rows shouldn't materialise
-    a 5 MB string in memory before the response goes out.  We yield
-    one CSV row per query result — constant memory regardless of
-    row count.
+    a 5 MB string in memory before the response goes out.  Rows are
+    written into one reusable buffer and yielded in ~64 KB chunks —
+    constant memory regardless of row count.
 
 Public API:
   - ``stream_csv_response(filename, header, row_iter)`` returns a
@@ -34,6 +34,12 @@ from typing import Any
 
 from fastapi.responses import StreamingResponse
 
+# Drain threshold for the row buffer, in characters (== bytes for the
+# ASCII-dominated audit columns).  Big enough to amortise the per-chunk
+# send, small enough that peak memory stays trivially bounded.
+_FLUSH_CHARS = 64 * 1024
+
+
 # ── Public API ──────────────────────────────────────────────────────
 
 
@@ -93,21 +99,24 @@ def stream_csv_response(
 
     def _generate() -> Iterator[bytes]:
         # Reuse a single StringIO buffer + csv.writer so we don't
-        # re-allocate per row.  Truncate-and-rewind after each yield
-        # to keep the buffer's underlying bytes scoped to one row.
+        # re-allocate per row, and only drain it once it holds about
+        # _FLUSH_CHARS of output.  StreamingResponse pulls each item
+        # of a sync iterator through a threadpool hop and a separate
+        # ASGI send, so yielding per row cost two of those (plus an
+        # encode copy) for every ~100-byte line of a 50k-row export.
         buf = io.StringIO()
         writer = csv.writer(buf, lineterminator="\r\n")
 
         writer.writerow(header)
-        yield buf.getvalue().encode("utf-8")
-        buf.seek(0)
-        buf.truncate()
-
         for row in rows:
             writer.writerow(row)
+            if buf.tell() >= _FLUSH_CHARS:
+                yield buf.getvalue().encode("utf-8")
+                buf.seek(0)
+                buf.truncate()
+
+        if buf.tell():
             yield buf.getvalue().encode("utf-8")
-            buf.seek(0)
-            buf.truncate()
 
     safe_name = _safe_filename_segment(filename) or "export.csv"
     if not safe_name.endswith(".csv"):
@@ -77,6 +77,12 @@ def _get_env() -> Environment:
             # the {% if %} ... {% endif %} guards.
             trim_blocks=True,
             lstrip_blocks=True,
+            # Templates ship in the image and only change with a deploy
+            # (which restarts the process), so skip Jinja's dev-mode
+            # freshness check — with the default ``auto_reload=True``
+            # every ``get_template`` stats the file, and each email
+            # pulls three templates plus the shared layout.
+            auto_reload=False,
         )
     return _env
 
@@ -202,7 +208,10 @@ class _NotificationProxy:
     @staticmethod
     def _parse_meta(notification) -> dict:
         raw = getattr(notification, "meta_json", None)
-        if not raw:
+        # Only a JSON object can yield a dict — sniff the first
+        # non-blank char so NULL, legacy plain-text, scalar and array
+        # values skip the parser and its exception path entirely.
+        if not raw or raw.lstrip()[:1] != "{":
             return {}
         try:
             import json as _json
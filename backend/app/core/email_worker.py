@@ -2,7 +2,8 @@
 Email worker — drains the EmailOutbox via Resend.
 
 Spawned in ``app.main.lifespan`` as a fire-and-forget asyncio task.
-Every ``EMAIL_WORKER_INTERVAL_SECONDS`` seconds:
+Every ``EMAIL_WORKER_INTERVAL_SECONDS`` seconds — or straight away when
+``wake_email_worker()`` signals that new rows were enqueued:
 
   1. Reclaim 'sending' rows older than 60s (worker died mid-flight).
   2. SELECT N pending rows ordered by created_at.
@@ -82,6 +83,36 @@ def seconds_since_last_tick() -> Optional[float]:
     return time.monotonic() - _last_tick_monotonic
 
 
+# ── Wake signal ─────────────────────────────────────────────────────
+# Set by ``wake_email_worker()`` after a caller commits new outbox
+# rows, so the loop drains them immediately instead of sitting out
+# the rest of its poll interval.  The interval stays as the fallback
+# cadence — retries flipped back to 'pending' and reclaimed 'sending'
+# rows have nobody to signal for them, and the health probe relies
+# on a tick at least that often.
+#
+# Both are bound by ``email_worker_loop`` on startup; ``None`` before
+# that (and in tests that drive ``run_one_tick`` directly), in which
+# case waking is a no-op.
+_wake_loop: Optional[asyncio.AbstractEventLoop] = None
+_wake_event: Optional[asyncio.Event] = None
+
+
+def wake_email_worker() -> None:
+    """Ask the worker loop to run a tick now rather than at its next
+    interval.  Safe to call from any thread — enqueue sites run in
+    threadpool request handlers as often as on the event loop.
+    """
+    loop, event = _wake_loop, _wake_event
+    if loop is None or event is None:
+        return
+    try:
+        loop.call_soon_threadsafe(event.set)
+    except RuntimeError:
+        # Loop already closed (shutdown race) — nothing left to wake.
+        pass
+
+
 def _reset_tick_for_tests() -> None:
     """Clear the in-process tick timestamp.  Used by health-endpoint
     tests that need the "never ticked" code path; production code
@@ -187,28 +218,41 @@ def run_one_tick(db: Session) -> dict:
 async def email_worker_loop():
     """Background loop spawned in main.py lifespan.
 
-    Wakes every ``EMAIL_WORKER_INTERVAL_SECONDS`` seconds and calls
-    ``run_one_tick``.  Sleeps cooperatively so cancellation is
-    immediate on shutdown.
+    Wakes every ``EMAIL_WORKER_INTERVAL_SECONDS`` seconds, or as soon
+    as ``wake_email_worker()`` fires, and calls ``run_one_tick``.
+    Waits cooperatively so cancellation is immediate on shutdown.
 
     Each iteration opens its own SessionLocal — same pattern the
     other background loops follow (``_log_cleanup_loop``,
     ``_offline_sweep_loop``).  Per-tick session means a SQL error in
     one tick doesn't poison the next.
+
+    The tick itself runs in a worker thread.  ``send_email`` is a
+    blocking Resend HTTP call (one per row, up to a full batch per
+    tick) and the outbox queries are sync SQLite — run inline they
+    stalled the event loop, and with it every HLS fetch, SSE stream
+    and node WebSocket, for the length of each send.
     """
+    global _wake_loop, _wake_event
     interval = max(1, settings.EMAIL_WORKER_INTERVAL_SECONDS)
+    _wake_loop = asyncio.get_running_loop()
+    _wake_event = asyncio.Event()
     while True:
         try:
-            await asyncio.sleep(interval)
+            await asyncio.wait_for(_wake_event.wait(), timeout=interval)
+        except TimeoutError:
+            pass
         except asyncio.CancelledError:
             return
+        # Clear before the tick, not after: rows enqueued while the
+        # tick is running set the event again and get their own pass
+        # rather than waiting out a full interval.
+        _wake_event.clear()
 
         try:
-            db = SessionLocal()
-            try:
-                summary = run_one_tick(db)
-            finally:
-                db.close()
+            summary = await asyncio.to_thread(_run_tick_with_session)
+        except asyncio.CancelledError:
+            return
         except Exception:
             # The whole tick failed (probably DB connection issue).
             # Log and keep looping — we don't want one bad tick to
@@ -228,6 +272,15 @@ async def email_worker_loop():
 
 # ── Internals ────────────────────────────────────────────────────────
 
+def _run_tick_with_session() -> dict:
+    """One tick on a fresh session — the unit the loop hands to a thread."""
+    db = SessionLocal()
+    try:
+        return run_one_tick(db)
+    finally:
+        db.close()
+
+
 def _process_row(
     db: Session, row: EmailOutbox
 ) -> tuple[str, Optional[str], Optional[str]]:
@@ -160,6 +160,12 @@ def delete_org_data(db: Session, org_id: str) -> dict[str, int]:
     """
     counts: dict[str, int] = {}
 
+    # Stream access-log rows are written by a periodic flush; drop any
+    # still queued for this org so the next flush can't re-insert the
+    # viewer email / IP / user-agent we're about to delete.
+    from app.api.hls import discard_pending_access_logs
+    discard_pending_access_logs(org_id)
+
     # Cascade-parent models go FIRST (per-row session.delete so the
     # cascade ON DELETE clauses on Camera + IncidentEvidence fire).
     # The bulk-delete loop below would bypass the SQLAlchemy
@@ -33,7 +33,6 @@ nominal limit).  We log a loud warning when falling back.
 from __future__ import annotations
 
 import base64
-import hashlib
 import json
 import logging
 
@@ -41,6 +40,7 @@ from fastapi import Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from app.core.auth import hash_api_key
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -48,13 +48,18 @@ logger = logging.getLogger(__name__)
 
 def _extract_org_from_jwt(token: str) -> str | None:
     """Pull ``org_id`` out of an unverified JWT payload. Returns None on
-    anything unparseable — callers fall back to IP in that case."""
+    anything unparseable — callers fall back to IP in that case.
+
+    Only the payload segment is sliced out and decoded — the header and
+    the (larger) signature are never copied."""
     try:
-        parts = token.split(".")
-        if len(parts) != 3:
+        first_dot = token.find(".")
+        second_dot = token.find(".", first_dot + 1)
+        if first_dot < 0 or second_dot < 0 or token.find(".", second_dot + 1) >= 0:
             return None
+        payload = token[first_dot + 1:second_dot]
         # Pad to a multiple of 4 so urlsafe_b64decode doesn't choke.
-        payload_b64 = parts[1] + "=" * (-len(parts[1]) % 4)
+        payload_b64 = payload + "=" * (-len(payload) % 4)
         claims = json.loads(base64.urlsafe_b64decode(payload_b64))
         # V1 flat claim or V2 compact "o" claim.
         org_id = claims.get("org_id") or claims.get("o", {}).get("id")
@@ -82,7 +87,9 @@ def _real_client_ip(request: Request) -> str:
     if xff:
         # XFF is a comma-separated chain appended as the request hops
         # through proxies; the left-most entry is the originating client.
-        first = xff.split(",")[0].strip()
+        # partition, not split: only the first hop matters, so don't
+        # build a list of every proxy in the chain.
+        first = xff.partition(",")[0].strip()
         if first:
             return first
 
@@ -95,7 +102,7 @@ def tenant_aware_key(request: Request) -> str:
     # prefix of its API key (not the raw key — never log or bucket on that).
     node_key = request.headers.get("X-Node-API-Key")
     if node_key:
-        digest = hashlib.sha256(node_key.encode()).hexdigest()[:16]
+        digest = hash_api_key(node_key)[:16]
         return f"node:{digest}"
 
     # End-user requests — one bucket per org.
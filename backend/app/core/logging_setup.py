@@ -15,12 +15,23 @@ Format produced::
 For lines outside any request context (background loops, startup,
 tests calling code directly), request_id and org_id render as "-"
 so the format stays aligned and grep-friendly.
+
+Records are handed off through a bounded queue.  The calling thread
+stamps the context, merges the message with its args (and renders any
+traceback) in ``QueueHandler.prepare`` so mutable args are captured as
+they were at the call, then does a non-blocking ``put``.  Line
+formatting and the stderr write happen on a ``QueueListener`` thread,
+so a burst of log lines (auth failures, node reconnect storms) never
+serialises request handlers on the stderr handler's lock.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from app.core.request_context import get_org_id, get_request_id
 
@@ -46,10 +57,65 @@ _LOG_FORMAT = (
 )
 _DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
+# Upper bound on records waiting for the listener thread.  At ~200
+# bytes a line that's ~2 MB worst case; if stderr is wedged long enough
+# to fill it, new records are dropped rather than blocking requests.
+_LOG_QUEUE_MAX_RECORDS = 10_000
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records when the queue is full instead of
+    routing ``queue.Full`` through ``handleError``, which would print a
+    traceback to the very stream that's backed up.
+
+    Drops are counted, and once the queue has room again a single
+    WARNING reporting the count goes out ahead of the next record, so a
+    gap in the log is never silent.
+    """
+
+    def __init__(self, queue_: queue.Queue) -> None:
+        super().__init__(queue_)
+        self._dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Every producer thread lands here, so the counter's read-modify-
+        # write and the notice/reset pair need the handler lock (an
+        # RLock, so re-entry from ``handle`` is fine).
+        with self.lock:
+            if self._dropped and not self._report_dropped():
+                self._dropped += 1
+                return
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self._dropped += 1
+
+    def _report_dropped(self) -> bool:
+        """Enqueue the "N records dropped" notice; False if still full.
+        Caller holds ``self.lock``."""
+        notice = logging.makeLogRecord({
+            "name": __name__,
+            "levelno": logging.WARNING,
+            "levelname": logging.getLevelName(logging.WARNING),
+            "msg": "[Logging] Log queue was full — dropped %d record(s)",
+            "args": (self._dropped,),
+        })
+        # Same producer-side treatment a regular record gets in handle()
+        # and emit(): context stamp, then pre-format for the listener.
+        self.filter(notice)
+        try:
+            self.queue.put_nowait(self.prepare(notice))
+        except queue.Full:
+            return False
+        self._dropped = 0
+        return True
+
+
 # Idempotency guard — configure_logging is called from main.py module
 # load, but a test that imports main multiple times shouldn't double-
 # install the handler.
 _configured = False
+_listener: QueueListener | None = None
 
 
 def configure_logging(level: int = logging.INFO) -> None:
@@ -63,13 +129,18 @@ def configure_logging(level: int = logging.INFO) -> None:
     ``logging.getLogger(__name__)`` which inherits from root and so
     picks up our format automatically.
     """
-    global _configured
+    global _configured, _listener
     if _configured:
         return
 
-    handler = logging.StreamHandler(sys.stderr)
-    handler.setFormatter(logging.Formatter(_LOG_FORMAT, datefmt=_DATE_FORMAT))
-    handler.addFilter(ContextFilter())
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(_LOG_FORMAT, datefmt=_DATE_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=_LOG_QUEUE_MAX_RECORDS)
+    queue_handler = _DroppingQueueHandler(log_queue)
+    # The filter MUST sit on the producer side: contextvars belong to
+    # the request's task/thread, and the listener thread has none.
+    queue_handler.addFilter(ContextFilter())
 
     root = logging.getLogger()
     # Drop existing root handlers so we don't double-emit the same
@@ -77,14 +148,25 @@ def configure_logging(level: int = logging.INFO) -> None:
     # handlers and are unaffected.
     for h in list(root.handlers):
         root.removeHandler(h)
-    root.addHandler(handler)
+    root.addHandler(queue_handler)
     root.setLevel(level)
 
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # Drain whatever is still queued on interpreter exit so the last
+    # lines before a crash/shutdown aren't lost.
+    atexit.register(_listener.stop)
+
     _configured = True
 
 
 def reset_for_tests() -> None:
-    """Test-only: clear the idempotency guard so configure_logging
-    can be called fresh.  Production code never calls this."""
-    global _configured
+    """Test-only: stop the listener and clear the idempotency guard so
+    configure_logging can be called fresh.  Production code never
+    calls this."""
+    global _configured, _listener
+    if _listener is not None:
+        atexit.unregister(_listener.stop)
+        _listener.stop()
+        _listener = None
     _configured = False
@@ -35,17 +35,27 @@ logger = logging.getLogger(__name__)
 # for security-alert latency.
 #
 # Tests can call ``_clear_cache`` to reset between runs.
+#
+# Copy-on-write: the dict bound to ``_cache`` is never mutated once
+# published.  Writers build a modified copy under ``_cache_lock`` and
+# rebind the module global; readers just load the current binding and
+# index it, with no lock at all.  Reads (every notification emit) vastly
+# outnumber writes (a Clerk fetch per org per 5 minutes), and the map
+# is tiny (two entries per active org), so copying on write is cheap.
+# Cached address lists are stored as tuples so a reader can't mutate
+# a snapshot that other readers share.
 
 _CACHE_TTL_SECONDS = 300
 
-_cache: dict[tuple[str, str], tuple[float, list[str]]] = {}
+_cache: dict[tuple[str, str], tuple[float, tuple[str, ...]]] = {}
 _cache_lock = Lock()
 
 
 def _clear_cache() -> None:
     """Reset the cache.  Used by tests; not exposed in public API."""
+    global _cache
     with _cache_lock:
-        _cache.clear()
+        _cache = {}
 
 
 # ── Public API ───────────────────────────────────────────────────────
@@ -79,20 +89,17 @@ def get_recipient_emails(org_id: str, audience: str) -> list[str]:
     audience = audience if audience in ("all", "admin") else "all"
     cache_key = (org_id, audience)
 
-    # Cache check — racy but the read-then-write is benign.  Worst
-    # case two concurrent callers both hit Clerk on the first miss
-    # and one of the writes wins.
-    with _cache_lock:
-        cached = _cache.get(cache_key)
+    # Cache check — lock-free read of the current snapshot.  Racy but
+    # the read-then-write is benign.  Worst case two concurrent callers
+    # both hit Clerk on the first miss and one of the writes wins.
+    cached = _cache.get(cache_key)
     if cached is not None:
         expires_at, addrs = cached
         if expires_at > time.monotonic():
-            return list(addrs)  # defensive copy so callers can't mutate cache
+            return list(addrs)
 
     addrs = _fetch_from_clerk(org_id, audience)
-
-    with _cache_lock:
-        _cache[cache_key] = (time.monotonic() + _CACHE_TTL_SECONDS, list(addrs))
+    _publish(cache_key, (time.monotonic() + _CACHE_TTL_SECONDS, tuple(addrs)))
 
     return list(addrs)
 
@@ -105,13 +112,22 @@ def invalidate_org(org_id: str) -> None:
     under 5 minutes (immediately, in fact).  Until that wiring lands
     the natural TTL handles staleness.
     """
+    global _cache
     with _cache_lock:
-        for key in [k for k in _cache if k[0] == org_id]:
-            _cache.pop(key, None)
+        _cache = {k: v for k, v in _cache.items() if k[0] != org_id}
 
 
 # ── Internals ────────────────────────────────────────────────────────
 
+def _publish(key: tuple[str, str], entry: tuple[float, tuple[str, ...]]) -> None:
+    """Swap in a copy of the cache with ``key`` set to ``entry``."""
+    global _cache
+    with _cache_lock:
+        updated = dict(_cache)
+        updated[key] = entry
+        _cache = updated
+
+
 def _fetch_from_clerk(org_id: str, audience: str) -> list[str]:
     """Call Clerk to list memberships and extract email addresses.
 
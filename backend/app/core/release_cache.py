@@ -32,7 +32,9 @@ available to your current version".
 """
 
 import logging
+import ssl
 import time
+from functools import lru_cache
 
 import httpx
 
@@ -58,6 +60,22 @@ _cached_release: dict | None = None
 _cached_at: float | None = None
 
 
+@lru_cache(maxsize=1)
+def _github_ssl_context() -> ssl.SSLContext:
+    """Process-wide TLS context for the GitHub fetch.
+
+    ``httpx.AsyncClient()`` with the default ``verify=True`` builds a
+    fresh context per client — a parse of the whole certifi CA bundle
+    every refresh tick and on every cold ``/downloads`` miss.  The
+    context is immutable once built and safe to share across event
+    loops, unlike the client itself (its connection pool is bound to
+    the loop that opened it, and the refresher and request handlers
+    don't necessarily share one in tests), so we cache the context and
+    keep the per-fetch client.
+    """
+    return httpx.create_ssl_context()
+
+
 def _strip_leading_v(tag: str) -> str:
     """Normalize ``v0.1.39`` → ``0.1.39``.
 
@@ -91,7 +109,7 @@ async def get_latest_release(*, force_refresh: bool = False) -> dict | None:
 
     url = f"https://api.github.com/repos/{CLOUDNODE_GH_REPO}/releases/latest"
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with httpx.AsyncClient(timeout=5.0, verify=_github_ssl_context()) as client:
             resp = await client.get(
                 url,
                 headers={"Accept": "application/vnd.github+json"},
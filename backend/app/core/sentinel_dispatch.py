@@ -33,6 +33,7 @@ import logging
 import threading
 import uuid
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 import httpx
@@ -40,6 +41,7 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.plans import effective_plan_for_caps
+from app.core.timezones import resolve_org_timezone
 from app.models.models import SentinelConfig, SentinelRun, Setting
 
 logger = logging.getLogger(__name__)
@@ -191,12 +193,7 @@ def _schedule_allows_now(cfg: SentinelConfig, db: Session) -> bool:
         return False
 
     # scheduled mode — check window + day-of-week
-    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
-    tz_name = Setting.get(db, cfg.org_id, "timezone", "UTC") or "UTC"
-    try:
-        tz = ZoneInfo(tz_name)
-    except (ZoneInfoNotFoundError, ValueError):
-        tz = ZoneInfo("UTC")
+    tz = resolve_org_timezone(cfg.org_id, Setting.get(db, cfg.org_id, "timezone", "UTC"))
 
     now_local = datetime.now(tz=tz)
     day_keys = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
@@ -564,6 +561,31 @@ def _compute_signature(body: bytes, secret: str) -> str:
     ).hexdigest()
 
 
+@lru_cache(maxsize=1)
+def _wakeup_client() -> httpx.Client:
+    """Process-wide client for the wakeup POST.
+
+    Building an ``httpx.Client`` per wakeup loaded a fresh SSL context
+    (the certifi bundle parse) and paid a new TCP + TLS handshake to the
+    agent on every dispatch.  One shared client keeps the context and a
+    pooled keep-alive connection, so back-to-back motion dispatches
+    reuse the socket.  ``httpx.Client`` is thread-safe, which matters
+    because each wakeup fires from its own daemon thread.
+    """
+    return httpx.Client(timeout=5.0)
+
+
+def close_wakeup_client() -> None:
+    """Close the shared wakeup client, if one was ever built, and drop
+    it from the cache so a later wakeup builds a fresh one instead of
+    posting through a closed client.  Called from the app's lifespan
+    shutdown.
+    """
+    if _wakeup_client.cache_info().currsize:
+        _wakeup_client().close()
+    _wakeup_client.cache_clear()
+
+
 def _fire_wakeup_webhook_blocking() -> None:
     """Run inside a thread.  Hits the agent webhook with a short
     timeout; logs and returns (any failure is non-fatal here).
@@ -581,23 +603,22 @@ def _fire_wakeup_webhook_blocking() -> None:
 
     try:
         signature = _compute_signature(_WAKEUP_PAYLOAD, secret)
-        with httpx.Client(timeout=5.0) as client:
-            resp = client.post(
-                url,
-                content=_WAKEUP_PAYLOAD,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Sentinel-Signature": signature,
-                },
+        resp = _wakeup_client().post(
+            url,
+            content=_WAKEUP_PAYLOAD,
+            headers={
+                "Content-Type": "application/json",
+                "X-Sentinel-Signature": signature,
+            },
+        )
+        if resp.status_code >= 400:
+            logger.warning(
+                "sentinel wakeup: %s returned %d — pending run will be "
+                "picked up by the next wakeup",
+                url, resp.status_code,
             )
-            if resp.status_code >= 400:
-                logger.warning(
-                    "sentinel wakeup: %s returned %d — pending run will be "
-                    "picked up by the next wakeup",
-                    url, resp.status_code,
-                )
-            else:
-                logger.debug("sentinel wakeup: pinged %s status=%d", url, resp.status_code)
+        else:
+            logger.debug("sentinel wakeup: pinged %s status=%d", url, resp.status_code)
     except Exception as exc:  # noqa: BLE001
         # Common case: the agent's machine is auto-stopped and Fly is
         # cold-starting it; the request returns before the boot
@@ -0,0 +1,35 @@
+"""
+Org timezone resolution.
+
+Three call sites interpret wall-clock settings in the org's ``timezone``
+Setting — the heartbeat's scheduled-recording window, Sentinel's
+schedule window, and the Sentinel "runs today" counter.  Each used to
+carry its own copy of the ZoneInfo-with-UTC-fallback dance; this is the
+one shared copy.
+"""
+
+import logging
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_org_timezone(org_id: str, tz_name: str | None) -> ZoneInfo:
+    """Return the IANA ``ZoneInfo`` for the org's ``timezone`` Setting
+    value (already fetched by the caller), defaulting to UTC.
+
+    Validated at the PATCH endpoint, but we still defend against bad
+    strings here (operator could hand-edit the DB, or the row could
+    pre-date a tighter validator) by falling back to UTC rather than
+    raising — an error here would 500 every heartbeat for the affected
+    org and stop their recording entirely.
+    """
+    tz_name = tz_name or "UTC"
+    try:
+        return ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning(
+            "Org %s has invalid timezone setting %r — falling back to UTC",
+            org_id, tz_name,
+        )
+        return ZoneInfo("UTC")
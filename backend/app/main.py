@@ -1,10 +1,11 @@
 import asyncio
 import logging
 import os
+import re
 import shutil
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -180,6 +181,11 @@ SENTINEL_REAPER_INTERVAL_SECONDS = int(
     os.getenv("SENTINEL_REAPER_INTERVAL_SECONDS", "300")
 )
 
+# Accepted shape for an inbound X-Request-Id (see request_context): 8-128
+# ASCII letters, digits and hyphens.  ASCII-only on purpose — anything
+# else would end up verbatim in log lines and Sentry tags.
+_RE_INBOUND_REQUEST_ID = re.compile(r"[A-Za-z0-9-]{8,128}")
+
 
 @asynccontextmanager
 async def lifespan(app):
@@ -230,6 +236,24 @@ async def lifespan(app):
     disk_check_task.cancel()
     motion_digest_task.cancel()
     sentinel_reaper_task.cancel()
+    # Final flush of queued stream access-log rows and MCP activity
+    # events — the periodic loop was just cancelled, and anything still
+    # queued would otherwise be lost on every deploy / restart.
+    try:
+        from app.api.hls import flush_access_logs
+        await asyncio.to_thread(flush_access_logs)
+    except Exception:
+        logger.exception("[App] Final access-log flush failed")
+    try:
+        from app.mcp.activity import stop_persist_writer
+        await asyncio.to_thread(stop_persist_writer)
+    except Exception:
+        logger.exception("[App] MCP activity writer drain failed")
+    try:
+        from app.core.sentinel_dispatch import close_wakeup_client
+        close_wakeup_client()
+    except Exception:
+        logger.exception("[App] Sentinel wakeup client close failed")
     print("[System] Shutdown complete")
 
 
@@ -419,10 +443,11 @@ app.add_middleware(
 async def request_context(request: Request, call_next):
     inbound = request.headers.get("X-Request-Id", "")
     # Sanity-check the inbound value before trusting it: 8-128 chars,
-    # alphanumerics + hyphens only.  Garbage / overly long strings get
-    # replaced with a fresh id — we don't want a malicious header
+    # ASCII alphanumerics + hyphens only.  Garbage / overly long strings
+    # get replaced with a fresh id — we don't want a malicious header
     # injecting weird characters into our log lines or Sentry tags.
-    if 8 <= len(inbound) <= 128 and inbound.replace("-", "").isalnum():
+    # One anchored regex pass covers length and charset together.
+    if _RE_INBOUND_REQUEST_ID.fullmatch(inbound):
         req_id = inbound
     else:
         req_id = new_request_id()
@@ -445,16 +470,30 @@ async def request_context(request: Request, call_next):
     return response
 
 
+# Static header set, built once at import.  FLY_APP_NAME is fixed for
+# the life of the machine, so the env lookup that used to run on every
+# response is resolved here too; only the per-request scheme check for
+# HSTS remains on the hot path, and it reads the ASGI scope directly
+# instead of building and re-parsing ``request.url``.
+_SECURITY_HEADERS: tuple[tuple[str, str], ...] = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    ("Permissions-Policy", "camera=(), microphone=(), geolocation=()"),
+)
+_HSTS_HEADER = ("Strict-Transport-Security", "max-age=63072000; includeSubDomains")
+_ALWAYS_HSTS = bool(os.getenv("FLY_APP_NAME"))
+
+
 @app.middleware("http")
 async def security_headers(request: Request, call_next):
     """Add security headers to all responses."""
     response = await call_next(request)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
-    if request.url.scheme == "https" or os.getenv("FLY_APP_NAME"):
-        response.headers["Strict-Transport-Security"] = "max-age=63072000; includeSubDomains"
+    headers = response.headers
+    for name, value in _SECURITY_HEADERS:
+        headers[name] = value
+    if _ALWAYS_HSTS or request.scope["scheme"] == "https":
+        headers[_HSTS_HEADER[0]] = _HSTS_HEADER[1]
     return response
 
 # Include API routers
@@ -608,6 +647,13 @@ def run_log_cleanup(db, *, default_retention_days: int = LOG_RETENTION_DAYS) ->
             .filter(EmailLog.org_id == org_id, EmailLog.timestamp < cutoff)
             .delete(synchronize_session=False)
         )
+        # Commit per org rather than once at the end.  SQLite has a
+        # single writer, and one transaction spanning every org's
+        # deletes held that lock (and grew the WAL) for the whole
+        # sweep — heartbeats, access-log rows and audit writes all
+        # queued behind it for up to busy_timeout.  Per-org commits
+        # bound each write burst to one tenant's expired rows.
+        db.commit()
 
     # EmailOutbox cleanup: cross-org, terminal-state-only, fixed
     # 7-day window.  Per-org tiering doesn't apply here because the
@@ -814,7 +860,8 @@ async def _release_cache_refresh_loop():
 
 
 async def _viewer_usage_flush_loop():
-    """Background task — flush per-org viewer-second counters to the DB.
+    """Background task — flush per-org viewer-second counters and queued
+    stream access-log rows to the DB.
 
     Runs every 60 seconds. Batching keeps the hot HLS-serve path O(1) in
     memory and amortizes writes to one UPSERT per active org per minute
@@ -825,10 +872,11 @@ async def _viewer_usage_flush_loop():
     while True:
         await asyncio.sleep(60)
         try:
-            from app.api.hls import flush_viewer_usage
-            # flush_viewer_usage does its own DB session + error handling;
+            from app.api.hls import flush_access_logs, flush_viewer_usage
+            # Both flushes do their own DB session + error handling;
             # we only care whether anything was written so we can log it.
             await asyncio.to_thread(flush_viewer_usage)
+            await asyncio.to_thread(flush_access_logs)
         except Exception:
             logger.exception("[ViewerUsage] Flush loop tick failed")
 
@@ -1202,7 +1250,7 @@ async def _sentinel_reaper_loop():
 #     budget; an attacker spamming with random keys hits the wall well
 #     before any meaningful DoS impact.
 _MCP_PRE_AUTH_LIMIT_PER_MINUTE = 600
-_mcp_pre_auth_buckets: dict[str, list[float]] = defaultdict(list)
+_mcp_pre_auth_buckets: dict[str, deque[float]] = defaultdict(deque)
 _mcp_pre_auth_lock = threading.Lock()
 
 
@@ -1220,9 +1268,11 @@ def _check_mcp_pre_auth_rate(request: Request) -> bool:
     cutoff = now - 60.0
     with _mcp_pre_auth_lock:
         bucket = _mcp_pre_auth_buckets[bucket_key]
-        # Drop stale entries in-place so the bucket size doesn't grow
-        # unbounded for a noisy tenant.
-        bucket[:] = [t for t in bucket if t > cutoff]
+        # Timestamps are appended in order, so stale entries are always
+        # at the left end — pop just those instead of rebuilding a
+        # 600-entry list on every /mcp/ request from a busy tenant.
+        while bucket and bucket[0] <= cutoff:
+            bucket.popleft()
         if len(bucket) >= _MCP_PRE_AUTH_LIMIT_PER_MINUTE:
             return False
         bucket.append(now)
@@ -1244,7 +1294,13 @@ if static_dir.exists():
         # by app/api/well_known.py — without explicit pass-through they'd be
         # served the React index.html, which would silently break security
         # scanners that grep for the file.
-        if request.url.path.startswith((
+        #
+        # Routing reads the raw ASGI path rather than ``request.url.path``:
+        # the URL property rebuilds the full URL string from the scope and
+        # urlsplit()s it again, and this middleware gets a fresh Request
+        # (so no cached URL) on every request the app serves.
+        path = request.scope["path"]
+        if path.startswith((
             "/api", "/ws", "/install.", "/mcp-setup.", "/downloads/",
             "/.well-known/", "/security.txt",
         )):
@@ -1255,7 +1311,7 @@ if static_dir.exists():
         #
         # Apply a pre-auth IP/tenant rate limit BEFORE the request hits
         # FastMCP — see ``_check_mcp_pre_auth_rate`` for the rationale.
-        if request.url.path.startswith("/mcp") and request.method == "POST":
+        if path.startswith("/mcp") and request.method == "POST":
             if not _check_mcp_pre_auth_rate(request):
                 return JSONResponse(
                     {"error": "Too many requests. Slow down and retry shortly."},
@@ -1264,11 +1320,11 @@ if static_dir.exists():
                 )
             return await call_next(request)
 
-        static_file = static_dir / request.url.path.lstrip("/")
+        static_file = static_dir / path.lstrip("/")
         if static_file.exists() and static_file.is_file():
             return FileResponse(static_file)
 
-        if not request.url.path.startswith("/api"):
+        if not path.startswith("/api"):
             index_file = static_dir / "index.html"
             if index_file.exists():
                 return FileResponse(index_file)
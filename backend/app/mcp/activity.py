@@ -8,6 +8,7 @@ and persists completed events to the database for audit.
 
 import asyncio
 import logging
+import queue
 import threading
 import time
 from collections import deque
@@ -18,30 +19,140 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
-def _persist_event(event: "McpEvent"):
-    """Write an MCP event to the database (runs in background thread)."""
+# Completed events waiting to be written.  A single daemon writer thread
+# drains this queue, so a burst of tool calls (an agent fanning out
+# view_camera across a dozen cameras, say) lands as one INSERT batch and
+# one commit instead of one thread + session + commit per call.  Bounded
+# so a wedged DB can't grow memory without limit — see _enqueue_persist.
+# The lifespan shutdown calls ``stop_persist_writer`` so whatever is
+# still queued gets written before the process exits.
+_PERSIST_QUEUE_MAX = 10_000
+_PERSIST_BATCH_MAX = 500
+_PERSIST_STOP = None  # sentinel: flush what's been collected, then exit
+_persist_queue: "queue.Queue[Optional[McpEvent]]" = queue.Queue(maxsize=_PERSIST_QUEUE_MAX)
+_persist_thread: Optional[threading.Thread] = None
+_persist_thread_lock = threading.Lock()
+# Set by ``stop_persist_writer``.  Once the lifespan has drained the
+# writer nothing will drain it again, so late events are written inline
+# rather than handed to a fresh daemon thread that would die unflushed.
+_persist_stopped = False
+
+
+def _persist_events(events: list["McpEvent"]) -> bool:
+    """Write a batch of MCP events to the database in one transaction.
+    Returns False (batch dropped) on failure."""
     try:
         from app.core.database import SessionLocal
         from app.models.models import McpActivityLog
 
         db = SessionLocal()
         try:
-            log = McpActivityLog(
-                org_id=event.org_id,
-                tool_name=event.tool_name,
-                key_name=event.key_name,
-                status=event.status,
-                duration_ms=int(event.duration_ms) if event.duration_ms else None,
-                args_summary=event.args_summary,
-                error=event.error,
-                timestamp=datetime.fromtimestamp(event.timestamp, tz=UTC).replace(tzinfo=None),
-            )
-            db.add(log)
+            db.add_all([
+                McpActivityLog(
+                    org_id=event.org_id,
+                    tool_name=event.tool_name,
+                    key_name=event.key_name,
+                    status=event.status,
+                    duration_ms=int(event.duration_ms) if event.duration_ms else None,
+                    args_summary=event.args_summary,
+                    error=event.error,
+                    timestamp=datetime.fromtimestamp(event.timestamp, tz=UTC).replace(tzinfo=None),
+                )
+                for event in events
+            ])
             db.commit()
         finally:
             db.close()
     except Exception:
-        logger.exception("[Activity] Failed to persist MCP event to DB")
+        logger.exception("[Activity] Failed to persist MCP activity batch to DB")
+        logger.error("[Activity] Dropped %d MCP activity event(s)", len(events))
+        return False
+    return True
+
+
+def _persist_worker():
+    """Block for the next event, then sweep up whatever else queued behind
+    it.  Exits after writing its last batch once the stop sentinel arrives."""
+    while True:
+        item = _persist_queue.get()
+        if item is _PERSIST_STOP:
+            return
+        batch = [item]
+        stopping = False
+        while len(batch) < _PERSIST_BATCH_MAX:
+            try:
+                item = _persist_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _PERSIST_STOP:
+                stopping = True
+                break
+            batch.append(item)
+        _persist_events(batch)
+        if stopping:
+            return
+
+
+def _ensure_persist_writer() -> bool:
+    """Start the writer thread on first use.  Returns False once
+    ``stop_persist_writer`` has run — the caller must not enqueue then."""
+    global _persist_thread
+    if _persist_thread is None:
+        with _persist_thread_lock:
+            if _persist_stopped:
+                return False
+            if _persist_thread is None:
+                _persist_thread = threading.Thread(
+                    target=_persist_worker, name="mcp-activity-writer", daemon=True,
+                )
+                _persist_thread.start()
+    return True
+
+
+def _enqueue_persist(event: "McpEvent"):
+    """Hand an event to the writer thread, starting it on first use.
+    After shutdown the event is written synchronously instead."""
+    if not _ensure_persist_writer():
+        _persist_events([event])
+        return
+    try:
+        _persist_queue.put_nowait(event)
+    except queue.Full:
+        # Audit rows are best-effort; dropping beats blocking the MCP
+        # request path behind a DB that has stopped accepting writes.
+        logger.warning("[Activity] Persist queue full — dropping MCP event %s", event.id)
+
+
+def stop_persist_writer(timeout: float = 10.0) -> None:
+    """Drain the persist queue and stop the writer thread (lifespan shutdown).
+
+    Blocking — call via ``asyncio.to_thread``.  Waits up to ``timeout``
+    seconds; anything still unwritten after that is logged as lost.
+    """
+    global _persist_thread, _persist_stopped
+    with _persist_thread_lock:
+        _persist_stopped = True
+        thread, _persist_thread = _persist_thread, None
+    if thread is None:
+        return
+    try:
+        _persist_queue.put(_PERSIST_STOP, timeout=timeout)
+    except queue.Full:
+        pass
+    thread.join(timeout)
+    if thread.is_alive():
+        logger.error(
+            "[Activity] Writer did not drain within %.0fs — ~%d MCP activity "
+            "event(s) not persisted", timeout, _persist_queue.qsize(),
+        )
+
+
+def _reset_persist_writer_for_tests() -> None:
+    """Re-arm the writer after a test has called ``stop_persist_writer``.
+    Production code never calls this."""
+    global _persist_stopped
+    with _persist_thread_lock:
+        _persist_stopped = False
 
 
 @dataclass
@@ -89,27 +200,33 @@ class McpActivityTracker:
         with self._lock:
             self._events.append(event)
 
-            # Track session
-            if event.org_id not in self._sessions:
-                self._sessions[event.org_id] = {}
-            sess = self._sessions[event.org_id]
-            if event.key_name not in sess:
-                sess[event.key_name] = {"call_count": 0}
-            sess[event.key_name]["last_active"] = event.timestamp
-            sess[event.key_name]["call_count"] += 1
+            # Track session — bind the per-key dict once instead of
+            # re-hashing org_id / key_name for every field touched.
+            sess = self._sessions.setdefault(event.org_id, {})
+            key_sess = sess.get(event.key_name)
+            if key_sess is None:
+                key_sess = sess[event.key_name] = {"call_count": 0}
+            key_sess["last_active"] = event.timestamp
+            key_sess["call_count"] += 1
 
             # Track total calls
             self._total_calls[event.org_id] = self._total_calls.get(event.org_id, 0) + 1
 
-        # Persist to DB in background thread (non-blocking)
-        threading.Thread(target=_persist_event, args=(event,), daemon=True).start()
+            # Snapshot the subscriber list in the same critical section.
+            # Tracked sync tools log from worker threads, so iterating the
+            # live list unlocked could race a subscribe/unsubscribe and
+            # skip a queue; copying here costs no extra lock round trip.
+            queues = list(self._subscribers.get(event.org_id, ()))
+
+        # Persist to DB via the batching writer thread (non-blocking)
+        _enqueue_persist(event)
 
         # Notify SSE subscribers (non-blocking)
-        self._notify(event)
+        if queues:
+            self._notify(event, queues)
 
-    def _notify(self, event: McpEvent):
-        """Push event to all SSE subscribers for this org."""
-        queues = self._subscribers.get(event.org_id, [])
+    def _notify(self, event: McpEvent, queues: list[asyncio.Queue]):
+        """Push event to the given SSE subscriber queues for this org."""
         dead = []
         for q in queues:
             try:
@@ -150,9 +267,10 @@ class McpActivityTracker:
     def unsubscribe(self, org_id: str, q: asyncio.Queue):
         """Remove an SSE subscription."""
         with self._lock:
-            if org_id in self._subscribers:
+            subscribers = self._subscribers.get(org_id)
+            if subscribers is not None:
                 try:
-                    self._subscribers[org_id].remove(q)
+                    subscribers.remove(q)
                 except ValueError:
                     pass
 
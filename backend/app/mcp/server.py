@@ -12,7 +12,6 @@ import base64
 import collections
 import contextvars
 import functools
-import hashlib
 import hmac
 import logging
 import threading
@@ -26,10 +25,12 @@ from fastmcp.exceptions import ToolError
 from fastmcp.server.dependencies import get_http_headers
 from fastmcp.server.middleware.middleware import Middleware
 from fastmcp.utilities.types import Image
+from mcp.types import ImageContent
 from pydantic import Field
 from sqlalchemy.orm import Session
 
 from app.api.hls import _segment_cache
+from app.core.auth import hash_api_key
 from app.core.config import settings
 from app.core.database import SessionLocal
 from app.mcp.activity import McpEvent, tracker
@@ -129,12 +130,22 @@ RATE_LIMITS = {
 DEFAULT_RATE_LIMIT = None  # Block unrecognized plans (MCP requires Pro+)
 
 
+# Lock stripes for _RateLimiter.  A power of two comfortably above the
+# number of MCP keys that are ever busy at the same moment.
+_RATE_LIMIT_LOCK_STRIPES = 16
+
+
 class _RateLimiter:
     """Thread-safe sliding-window rate limiter keyed by API key hash.
 
     Tracks two windows in parallel per key: a 60-second minute window and a
     24-hour daily window. A request is only allowed when both windows have
     headroom; the failure message tells the caller which window they tripped.
+
+    Locking is striped by key hash: each key always maps to the same one
+    of ``_RATE_LIMIT_LOCK_STRIPES`` locks, so two keys only contend when
+    they share a stripe.  A single global lock made every MCP client
+    queue behind whichever one was purging a long daily deque.
     """
 
     def __init__(self):
@@ -143,7 +154,12 @@ class _RateLimiter:
         # but we only touch it on a request, not in a background sweep).
         self._minute: dict[str, collections.deque] = {}
         self._daily: dict[str, collections.deque] = {}
-        self._lock = threading.Lock()
+        self._locks = tuple(
+            threading.Lock() for _ in range(_RATE_LIMIT_LOCK_STRIPES)
+        )
+
+    def _lock_for(self, key_hash: str) -> threading.Lock:
+        return self._locks[hash(key_hash) % _RATE_LIMIT_LOCK_STRIPES]
 
     def check(
         self,
@@ -162,7 +178,10 @@ class _RateLimiter:
         minute_cutoff = now - 60.0
         daily_cutoff = now - 86_400.0
 
-        with self._lock:
+        # The per-key deques are only ever touched under this key's
+        # stripe; the shared dicts themselves are safe for concurrent
+        # setdefault under the GIL.
+        with self._lock_for(key_hash):
             minute_dq = self._minute.setdefault(key_hash, collections.deque())
             daily_dq = self._daily.setdefault(key_hash, collections.deque())
 
@@ -231,10 +250,10 @@ class ScopeMiddleware(Middleware):
         auth = (headers or {}).get("authorization", "")
         if not auth.lower().startswith("bearer "):
             return None
-        raw_key = auth.split(" ", 1)[1].strip()
+        raw_key = auth.partition(" ")[2].strip()
         if not raw_key:
             return None
-        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+        key_hash = hash_api_key(raw_key)
 
         db = SessionLocal()
         try:
@@ -245,7 +264,16 @@ class ScopeMiddleware(Middleware):
             )
             if not mcp_key:
                 return None
-            return compute_allowed_tools(mcp_key.scope_mode, mcp_key.get_scope_tools())
+            # scope_tools is a JSON column only consulted for "custom"
+            # keys; skip the parse for "all"/"readonly" keys, which is
+            # nearly every call this middleware sees.
+            scope_mode = mcp_key.scope_mode
+            scope_tools = (
+                mcp_key.get_scope_tools()
+                if (scope_mode or "").lower() == "custom"
+                else None
+            )
+            return compute_allowed_tools(scope_mode, scope_tools)
         except Exception:
             logger.exception("ScopeMiddleware: key lookup failed")
             return None
@@ -297,22 +325,26 @@ def _resolve_org(headers: dict | None) -> tuple[str, Session]:
     if not auth.lower().startswith("bearer "):
         raise ToolError("Unauthorized: missing Bearer token")
 
-    raw_key = auth.split(" ", 1)[1].strip()
+    raw_key = auth.partition(" ")[2].strip()
     if not raw_key:
         raise ToolError("Unauthorized: empty Bearer token")
 
+    # Hashed once up front: Path 2 compares it against the agent key's
+    # digest, Path 1 looks it up in McpApiKey.
+    key_hash = hash_api_key(raw_key)
+
     # ── Path 2: agent multi-tenant key ──────────────────────────────
-    # Constant-time compare against the configured agent key so a
-    # length-leak on `==` doesn't reveal anything about the secret.
-    # Empty agent key (unset env var) hard-rejects every attempt
-    # because hmac.compare_digest("", anything) is False.
+    # Compare SHA-256 digests rather than the raw strings: both sides
+    # are always 64 hex chars, so timing depends on neither the
+    # bearer's length nor how much of a prefix it shares with the
+    # secret, and compare_digest never sees non-ASCII input (it raises
+    # TypeError on that).
+    # Empty agent key (unset env var) hard-rejects every attempt.
     agent_key = settings.SENTINEL_AGENT_MCP_KEY
-    if agent_key and hmac.compare_digest(raw_key, agent_key):
+    if agent_key and hmac.compare_digest(key_hash, hash_api_key(agent_key)):
         return _resolve_via_agent_key(headers, agent_key)
 
     # ── Path 1: per-org osc_* key (existing behaviour) ──────────────
-    key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
-
     db = SessionLocal()
     try:
         mcp_key = (
@@ -681,42 +713,15 @@ def get_stream_url(
 @tracked
 async def view_camera(
     camera_id: Annotated[str, "The camera_id to view (e.g. 'node1-video0')"],
-) -> Image:
+) -> ImageContent:
     org_id, db = _auth()
     try:
-        cam = (
-            db.query(Camera)
-            .filter_by(org_id=org_id, camera_id=camera_id)
-            .first()
-        )
-        if not cam:
-            raise ToolError(f"Camera '{camera_id}' not found")
-
-        node = db.query(CameraNode).filter_by(id=cam.node_id).first()
-        if not node:
-            raise ToolError(f"Camera '{camera_id}' has no assigned node")
-
-        node_id = node.node_id
+        node_id = _resolve_camera_node_id(db, org_id, camera_id)
     finally:
         db.close()
 
-    # Send take_snapshot command to CloudNode via WebSocket
-    from app.api.ws import manager
-
-    if not manager.is_connected(node_id):
-        raise ToolError(f"Node '{node_id}' is offline — cannot capture snapshot")
-
-    try:
-        result = await manager.send_command(
-            node_id, "take_snapshot", {"camera_id": camera_id}, timeout=15.0,
-        )
-    except TimeoutError:
-        raise ToolError("Snapshot timed out — camera node did not respond in time") from None
-    except ValueError as e:
-        raise ToolError(str(e)) from e
-
-    image_b64 = _extract_snapshot_image_b64(result, camera_id)
-    return Image(data=base64.b64decode(image_b64), format="jpeg")
+    image_b64 = await _capture_snapshot_b64(node_id, camera_id)
+    return _jpeg_content(image_b64)
 
 
 @mcp.tool(
@@ -739,19 +744,7 @@ async def watch_camera(
 ):
     org_id, db = _auth()
     try:
-        cam = (
-            db.query(Camera)
-            .filter_by(org_id=org_id, camera_id=camera_id)
-            .first()
-        )
-        if not cam:
-            raise ToolError(f"Camera '{camera_id}' not found")
-
-        node = db.query(CameraNode).filter_by(id=cam.node_id).first()
-        if not node:
-            raise ToolError(f"Camera '{camera_id}' has no assigned node")
-
-        node_id = node.node_id
+        node_id = _resolve_camera_node_id(db, org_id, camera_id)
     finally:
         db.close()
 
@@ -768,15 +761,15 @@ async def watch_camera(
             result = await manager.send_command(
                 node_id, "take_snapshot", {"camera_id": camera_id}, timeout=15.0,
             )
-            image_b64 = result.get("data", {}).get("image_b64") or result.get("image_b64")
-            if image_b64:
-                results.append(Image(data=base64.b64decode(image_b64), format="jpeg"))
-            else:
-                results.append(f"[Frame {i+1}] No image data returned")
-        except (TimeoutError, ValueError) as e:
+            # Same response parsing as view_camera / attach_snapshot, so a
+            # node-side failure reads identically across all three tools;
+            # here it becomes a per-frame note instead of failing the burst.
+            image_b64 = _extract_snapshot_image_b64(result, camera_id)
+            results.append(_jpeg_content(image_b64))
+        except (TimeoutError, ValueError, ToolError) as e:
             results.append(f"[Frame {i+1}] Failed: {e}")
 
-    if not any(isinstance(r, Image) for r in results):
+    if not any(isinstance(r, ImageContent) for r in results):
         raise ToolError("Failed to capture any snapshots — check node status")
 
     return results
@@ -1201,27 +1194,47 @@ def _extract_snapshot_image_b64(result: dict, camera_id: str) -> str:
     return image_b64
 
 
-async def _capture_snapshot_bytes(
-    org_id: str, camera_id: str
-) -> tuple[bytes, str]:
-    """Pull a fresh JPEG snapshot from a camera node via the WS bridge.
-    Returns (jpeg_bytes, node_id). Raises ToolError on any failure."""
-    db = SessionLocal()
-    try:
-        cam = (
-            db.query(Camera)
-            .filter_by(org_id=org_id, camera_id=camera_id)
-            .first()
-        )
-        if not cam:
-            raise ToolError(f"Camera '{camera_id}' not found")
-        node = db.query(CameraNode).filter_by(id=cam.node_id).first()
-        if not node:
-            raise ToolError(f"Camera '{camera_id}' has no assigned node")
-        node_id = node.node_id
-    finally:
-        db.close()
+def _resolve_camera_node_id(db: Session, org_id: str, camera_id: str) -> str:
+    """Map an org-scoped camera_id to the node_id that serves it.
+
+    Shared by every tool that asks a CloudNode for a frame
+    (view_camera, watch_camera, attach_snapshot), each on the session
+    it opened for auth.  Raises ToolError for an unknown
+    camera or one with no assigned node.
+    """
+    cam = (
+        db.query(Camera)
+        .filter_by(org_id=org_id, camera_id=camera_id)
+        .first()
+    )
+    if not cam:
+        raise ToolError(f"Camera '{camera_id}' not found")
+    node = db.query(CameraNode).filter_by(id=cam.node_id).first()
+    if not node:
+        raise ToolError(f"Camera '{camera_id}' has no assigned node")
+    return node.node_id
+
+
+def _jpeg_content(image_b64: str) -> ImageContent:
+    """Wrap a node's base64 JPEG as MCP image content as-is.
+
+    MCP carries images base64-encoded, which is exactly what the node
+    sends.  Going through fastmcp's ``Image(data=bytes)`` meant decoding
+    every frame only for fastmcp to re-encode it on the way out — two
+    full passes over a ~100 KB+ JPEG per view_camera / watch_camera
+    frame for no change in the bytes.
+    """
+    return ImageContent(type="image", data=image_b64, mimeType="image/jpeg")
+
+
+async def _capture_snapshot_b64(node_id: str, camera_id: str) -> str:
+    """Pull a fresh JPEG snapshot (base64, as the node sends it) from a
+    camera node via the WS bridge.
 
+    The caller resolves ``node_id`` with ``_resolve_camera_node_id`` on
+    the session it already opened for auth, and closes that session
+    before calling — the DB isn't held open across the node round trip.
+    Raises ToolError on any failure."""
     from app.api.ws import manager
 
     if not manager.is_connected(node_id):
@@ -1236,8 +1249,7 @@ async def _capture_snapshot_bytes(
     except ValueError as e:
         raise ToolError(str(e)) from e
 
-    image_b64 = _extract_snapshot_image_b64(result, camera_id)
-    return base64.b64decode(image_b64), node_id
+    return _extract_snapshot_image_b64(result, camera_id)
 
 
 @mcp.tool(
@@ -1323,8 +1335,7 @@ def create_incident(
             # creation — the agent already wrote the row, and the
             # human can find it in the dashboard regardless.  Logged
             # for triage but not surfaced to the agent.
-            import logging as _logging
-            _logging.getLogger(__name__).exception(
+            logger.exception(
                 "[create_incident] notification emit failed for incident=%s",
                 incident.id,
             )
@@ -1424,10 +1435,11 @@ async def attach_snapshot(
         )
         if not incident:
             raise ToolError(f"Incident {incident_id} not found")
+        node_id = _resolve_camera_node_id(db, org_id, camera_id)
     finally:
         db.close()
 
-    jpeg_bytes, _node_id = await _capture_snapshot_bytes(org_id, camera_id)
+    jpeg_bytes = base64.b64decode(await _capture_snapshot_b64(node_id, camera_id))
 
     db = SessionLocal()
     try:
@@ -1548,6 +1560,9 @@ def attach_clip(
         )
     blob = b"".join(chunks)
     segment_count = len(chunks)
+    # The joined blob is the only copy we need from here on; drop the
+    # per-segment list so the clip isn't held twice across the commit.
+    del chunks
     approx_duration = round(segment_count * _APPROX_SEGMENT_SECONDS, 1)
 
     db = SessionLocal()
@@ -1820,6 +1835,15 @@ def get_incident(
         db.close()
 
 
+# Stored evidence mime type → fastmcp Image format.
+_EVIDENCE_IMAGE_FORMATS: dict[str, str] = {
+    "image/jpeg": "jpeg",
+    "image/jpg": "jpeg",
+    "image/png": "png",
+    "image/webp": "webp",
+}
+
+
 @mcp.tool(
     name="get_incident_snapshot",
     description=(
@@ -1859,15 +1883,9 @@ def get_incident_snapshot(
             )
 
         # Map stored mime type to the Image format fastmcp expects.
+        # Unknown types fall back to jpeg — the data likely still decodes.
         mime = (evidence.data_mime or "image/jpeg").lower()
-        if mime == "image/jpeg" or mime == "image/jpg":
-            fmt = "jpeg"
-        elif mime == "image/png":
-            fmt = "png"
-        elif mime == "image/webp":
-            fmt = "webp"
-        else:
-            fmt = "jpeg"  # sensible fallback — the data likely still decodes
+        fmt = _EVIDENCE_IMAGE_FORMATS.get(mime, "jpeg")
 
         return Image(data=bytes(evidence.data), format=fmt)
     finally:
@@ -1909,7 +1927,7 @@ def get_incident_clip(
             raise ToolError(
                 f"Evidence {evidence_id} not found on incident {incident_id}"
             )
-        if evidence.kind != "clip" or evidence.data is None:
+        if evidence.kind != "clip" or not evidence.has_data:
             raise ToolError(
                 f"Evidence {evidence_id} is not a clip with attached video data"
             )
@@ -1932,7 +1950,9 @@ def get_incident_clip(
         d.update({
             "mime": base_mime,
             "approx_duration_seconds": approx_duration,
-            "bytes": len(evidence.data),
+            # Measured by SQLite (``length(data)``) — the blob itself is
+            # deferred and never leaves the database for a metadata call.
+            "bytes": evidence.data_size,
             "playback_hint": (
                 "A human reviewer can play this clip from the dashboard's "
                 "incident detail view; agents cannot watch video directly."
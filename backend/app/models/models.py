@@ -1,4 +1,6 @@
+from collections import deque
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
 from sqlalchemy import (
     BigInteger,
@@ -12,8 +14,9 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    func,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, deferred, relationship
 
 from app.core.database import Base
 
@@ -215,14 +218,25 @@ class AuditLog(Base):
     details = Column(Text)
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat(),
-            "event": self.event,
-            "ip": self.ip_address,
-            "username": self.username,
-            "details": self.details,
-        }
+        return _audit_row_to_dict(self)
+
+
+def _audit_row_to_dict(row) -> dict:
+    """API shape for an audit log entry.
+
+    Takes anything with AuditLog's attribute names — an ``AuditLog``
+    instance or a column-tuple row from ``db.query(AuditLog.id, ...)``
+    — so the list endpoint can skip entity hydration without keeping
+    its own copy of this dict.
+    """
+    return {
+        "id": row.id,
+        "timestamp": row.timestamp.isoformat(),
+        "event": row.event,
+        "ip": row.ip_address,
+        "username": row.username,
+        "details": row.details,
+    }
 
 
 class CameraNode(Base):
@@ -359,6 +373,27 @@ class StreamAccessLog(Base):
         }
 
 
+@lru_cache(maxsize=256)
+def _parse_scope_tools(raw: str) -> tuple[str, ...]:
+    """Parse a ``McpApiKey.scope_tools`` JSON list.
+
+    Custom-scoped keys have this parsed on every MCP tools/list and
+    tools/call (ScopeMiddleware re-reads the row each time so dashboard
+    edits apply immediately).  The column only changes when an admin
+    edits the key, so memoise on the raw string — an edit produces a
+    new string and a fresh parse.  Tuple so the cached value can't be
+    mutated through a caller's list.
+    """
+    import json
+    try:
+        val = json.loads(raw)
+        if isinstance(val, list):
+            return tuple(str(v) for v in val)
+    except (ValueError, TypeError):
+        pass
+    return ()
+
+
 class McpApiKey(Base):
     __tablename__ = "mcp_api_keys"
 
@@ -382,14 +417,7 @@ class McpApiKey(Base):
         """Return the parsed scope_tools list, or [] if unset/invalid."""
         if not self.scope_tools:
             return []
-        import json
-        try:
-            val = json.loads(self.scope_tools)
-            if isinstance(val, list):
-                return [str(v) for v in val]
-        except (ValueError, TypeError):
-            pass
-        return []
+        return list(_parse_scope_tools(self.scope_tools))
 
     def to_dict(self):
         return {
@@ -510,10 +538,19 @@ class IncidentEvidence(Base):
     kind = Column(String(20), nullable=False)  # "snapshot" | "observation" | "action"
     text = Column(Text, nullable=True)
     camera_id = Column(String(100), nullable=True)
-    data = Column(LargeBinary, nullable=True)
+    # Deferred: clip blobs run to several MB and almost every read of
+    # this row (incident detail, GDPR export, the post-insert refresh in
+    # attach_clip) only needs metadata.  Loading ``data`` is opt-in via
+    # attribute access or ``undefer()``; ``has_data`` / ``data_size``
+    # are computed by SQLite so callers never pull the bytes into
+    # Python just to test or measure them.
+    data = deferred(Column(LargeBinary, nullable=True))
     data_mime = Column(String(50), nullable=True)
     timestamp = Column(DateTime, default=lambda: datetime.now(tz=UTC).replace(tzinfo=None))
 
+    has_data = column_property(data.columns[0].isnot(None))
+    data_size = column_property(func.coalesce(func.length(data.columns[0]), 0))
+
     incident = relationship("Incident", back_populates="evidence")
 
     def to_dict(self) -> dict:
@@ -524,7 +561,7 @@ class IncidentEvidence(Base):
             "kind": self.kind,
             "text": self.text,
             "camera_id": self.camera_id,
-            "has_data": self.data is not None,
+            "has_data": bool(self.has_data),
             "data_mime": self.data_mime,
             "timestamp": self.timestamp.isoformat() if self.timestamp else None,
         }
@@ -574,6 +611,11 @@ class MotionEvent(Base):
         }
 
 
+# Characters a JSON document can begin with (after leading whitespace):
+# object, array, string, number, true/false/null.
+_JSON_VALUE_STARTS = frozenset('{["-0123456789tfn')
+
+
 class Notification(Base):
     """A user-facing notification in the org inbox.
 
@@ -626,9 +668,13 @@ class Notification(Base):
     def to_dict(self) -> dict:
         import json as _json
         meta = None
-        if self.meta_json:
+        raw = self.meta_json
+        # Runs per row on every inbox page; anything whose first
+        # non-blank character can't start a JSON value (legacy plain
+        # text, mostly) can't parse, so skip the try/except.
+        if raw and raw.lstrip()[:1] in _JSON_VALUE_STARTS:
             try:
-                meta = _json.loads(self.meta_json)
+                meta = _json.loads(raw)
             except (ValueError, TypeError):
                 meta = None
         return {
@@ -1180,7 +1226,9 @@ class SentinelRun(Base):
             return value if len(value) <= limit else value[:limit] + "…"
 
         sanitized: list[dict] = []
-        for entry in list(trace)[-50:]:
+        # deque(maxlen) keeps only the tail while iterating, rather than
+        # copying a runaway trace into a full list just to slice it.
+        for entry in deque(trace, maxlen=50):
             if not isinstance(entry, dict):
                 continue
             tool_name = _cap_str(entry.get("tool", ""), 200)
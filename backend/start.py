@@ -1,4 +1,14 @@
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    # Local dev entry point only — production runs uvicorn straight from
+    # the Dockerfile CMD with a single worker (broadcasters, the node
+    # WebSocket manager and the HLS caches are all in-process state, so
+    # extra workers would split them, not add capacity).
+    #
+    # Scope the reloader to the application package.  Left at its
+    # default it watches the whole backend directory, including
+    # ``.venv`` and ``static/`` — every ``uv sync`` or frontend build
+    # then restarts the server, and without watchfiles the stat-based
+    # fallback re-walks all of those files several times a second.
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True, reload_dirs=["app"])
@@ -5,6 +5,7 @@ Sets up an in-memory SQLite database and a FastAPI test client
 with Clerk auth bypassed (mocked).
 """
 
+import json
 import os
 
 import pytest
@@ -36,6 +37,13 @@ def _override_get_db():
             pass  # StaticPool + background threads can cause benign rollback errors
 
 
+def sse_event(frame: str) -> dict:
+    """Decode one ``data: <json>\\n\\n`` SSE frame — what the motion and
+    notification broadcasters put on subscriber queues."""
+    assert frame.startswith("data: ") and frame.endswith("\n\n"), frame
+    return json.loads(frame[len("data: "):])
+
+
 # ── Fixtures ─────────────────────────────────────────────────────
 
 @pytest.fixture(autouse=True)
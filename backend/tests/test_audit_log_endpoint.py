@@ -77,6 +77,19 @@ def test_audit_logs_orders_newest_first(admin_client, seeded_audit):
     assert timestamps == sorted(timestamps, reverse=True)
 
 
+def test_audit_logs_rows_match_model_to_dict(admin_client, db, seeded_audit):
+    """The list path reads column tuples, not entities — its rows must
+    still come out exactly as ``AuditLog.to_dict()`` renders them."""
+    body = admin_client.get("/api/audit-logs").json()
+    expected = [
+        row.to_dict()
+        for row in db.query(AuditLog)
+        .filter(AuditLog.org_id == TEST_ORG)
+        .order_by(AuditLog.timestamp.desc())
+    ]
+    assert body["logs"] == expected
+
+
 # ── Org isolation — the highest-impact assertion in this file ─────
 
 
@@ -489,3 +489,48 @@ def test_camera_groups_crud(admin_client):
     resp = admin_client.get("/api/camera-groups")
     assert len(resp.json()) == 0
 
+
+
+def test_delete_camera_group_detaches_members_and_scopes_to_org(admin_client, db):
+    """Deleting a group nulls its cameras' group_id; other orgs' groups 404."""
+    from app.models.models import Camera, CameraGroup
+
+    cam_id = _seed_camera(db, camera_id="cam_grouped")
+    own = CameraGroup(org_id="org_test123", name="Backyard")
+    foreign = CameraGroup(org_id="org_other", name="Not yours")
+    db.add_all([own, foreign])
+    db.flush()
+    db.query(Camera).filter_by(camera_id=cam_id).update({"group_id": own.id})
+    db.commit()
+    own_id, foreign_id = own.id, foreign.id
+
+    resp = admin_client.delete(f"/api/camera-groups/{foreign_id}")
+    assert resp.status_code == 404
+
+    resp = admin_client.delete(f"/api/camera-groups/{own_id}")
+    assert resp.status_code == 200
+    assert resp.json() == {"success": True, "deleted": "Backyard"}
+
+    db.expire_all()
+    assert db.query(Camera).filter_by(camera_id=cam_id).one().group_id is None
+    assert db.get(CameraGroup, own_id) is None
+    assert db.get(CameraGroup, foreign_id) is not None
+
+
+def test_list_camera_groups_reports_camera_count(admin_client, db):
+    """camera_count comes from the aggregate join — empty groups report 0."""
+    from app.models.models import Camera, CameraGroup
+
+    busy = CameraGroup(org_id="org_test123", name="Busy")
+    empty = CameraGroup(org_id="org_test123", name="Empty")
+    db.add_all([busy, empty])
+    db.flush()
+    for cam_id in ("cam_a", "cam_b"):
+        _seed_camera(db, camera_id=cam_id)
+        db.query(Camera).filter_by(camera_id=cam_id).update({"group_id": busy.id})
+    db.commit()
+
+    resp = admin_client.get("/api/camera-groups")
+    assert resp.status_code == 200
+    counts = {g["name"]: g["camera_count"] for g in resp.json()}
+    assert counts == {"Busy": 2, "Empty": 0}
@@ -92,6 +92,14 @@ def test_notification_proxy_handles_non_dict_meta():
     assert proxy.meta == {}
 
 
+def test_notification_proxy_parses_whitespace_prefixed_meta():
+    """Leading whitespace before the object is still valid JSON and
+    must not be mistaken for a non-object by the first-char sniff."""
+    notif = _fake_notif(meta_json='  \n{"incident_id": 7}')
+    proxy = email_templates._NotificationProxy(notif)
+    assert proxy.meta == {"incident_id": 7}
+
+
 # ── render() integration ─────────────────────────────────────────────
 
 def test_render_camera_offline_produces_three_strings():
@@ -14,6 +14,7 @@ failed | back-to-pending} → log row.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta, timezone
 
 import pytest
@@ -369,3 +370,44 @@ def test_worker_no_op_on_empty_queue(db, stub_send):
     assert summary == {"sent": 0, "failed": 0, "suppressed": 0, "reclaimed": 0}
     assert len(stub_send.calls) == 0
     assert db.query(EmailLog).count() == 0
+
+
+# ── Wake signal ─────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_wake_runs_a_tick_before_the_interval(monkeypatch):
+    """``wake_email_worker()`` from another thread cuts the poll short
+    — a freshly enqueued alert goes out now, not up to an interval
+    later.  Interval is pinned far above the test's wait so only the
+    wake can explain the tick."""
+    ticked = asyncio.Event()
+
+    def fake_tick():
+        loop.call_soon_threadsafe(ticked.set)
+        return {"sent": 0, "failed": 0, "suppressed": 0, "reclaimed": 0}
+
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(email_worker.settings, "EMAIL_WORKER_INTERVAL_SECONDS", 3600)
+    monkeypatch.setattr(email_worker, "_run_tick_with_session", fake_tick)
+    # Restore the module-level bindings the loop installs on startup.
+    monkeypatch.setattr(email_worker, "_wake_loop", None)
+    monkeypatch.setattr(email_worker, "_wake_event", None)
+
+    task = asyncio.create_task(email_worker.email_worker_loop())
+    try:
+        while email_worker._wake_event is None:
+            await asyncio.sleep(0)
+        await asyncio.to_thread(email_worker.wake_email_worker)
+        await asyncio.wait_for(ticked.wait(), timeout=2.0)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+def test_wake_is_a_no_op_without_a_running_worker(monkeypatch):
+    """Enqueue sites call this unconditionally; with no loop bound
+    (tests driving ``run_one_tick``, or before lifespan starts) it
+    must quietly do nothing."""
+    monkeypatch.setattr(email_worker, "_wake_loop", None)
+    monkeypatch.setattr(email_worker, "_wake_event", None)
+    email_worker.wake_email_worker()
@@ -170,7 +170,7 @@ def test_health_detailed_does_not_leak_org_or_camera_ids(
     from app.api.hls import _playlist_cache, _segment_cache
     from app.api.notifications import notification_broadcaster
 
-    _playlist_cache["org_secret_camera_123"] = ("playlist body", 0.0)
+    _playlist_cache["org_secret_camera_123"] = (b"playlist body", 0.0)
     _segment_cache["org_secret_camera_123"] = {}
     notification_broadcaster._subscribers["org_secret_456"] = [
         (_asyncio.Queue(), False),
@@ -22,6 +22,8 @@ Covers:
 import hashlib
 import uuid
 
+import pytest
+
 from app.models.models import Camera, CameraNode
 
 # ── Helpers ───────────────────────────────────────────────────────────
@@ -98,6 +100,51 @@ def test_segment_fetch_missing_returns_404(admin_client, db):
     assert resp.status_code == 404
 
 
+def test_segment_fetch_checks_camera_before_filename(admin_client, db):
+    """Ownership is resolved before the filename is validated: a bad
+    filename on an unknown or another org's camera is a 404 (nothing to
+    see here), and only on the caller's own camera does it become 400."""
+    _raw_key, own_cam = _seed_node_with_camera(db)
+    _other_key, foreign_cam = _seed_node_with_camera(db, org_id="org_OTHER999")
+
+    for cam_id in ("cam_does_not_exist", foreign_cam):
+        resp = admin_client.get(f"/api/cameras/{cam_id}/segment/evil.txt")
+        assert resp.status_code == 404, cam_id
+
+    resp = admin_client.get(f"/api/cameras/{own_cam}/segment/evil.txt")
+    assert resp.status_code == 400
+
+
+def test_push_auth_distinguishes_bad_key_from_foreign_camera(
+    unauthenticated_client, db
+):
+    """Node pushes resolve node + camera in one join; on a miss the
+    status must still tell an unknown key (401) apart from a valid key
+    aimed at a camera the node doesn't own (404)."""
+    raw_key, cam_id = _seed_node_with_camera(db)
+    other_key, other_cam = _seed_node_with_camera(db)
+
+    resp = unauthenticated_client.post(
+        f"/api/cameras/{cam_id}/push-segment?filename=segment_00001.ts",
+        content=b"\x00",
+        headers={"X-Node-API-Key": "not-a-real-key"},
+    )
+    assert resp.status_code == 401
+
+    resp = unauthenticated_client.post(
+        f"/api/cameras/{other_cam}/push-segment?filename=segment_00001.ts",
+        content=b"\x00",
+        headers={"X-Node-API-Key": raw_key},
+    )
+    assert resp.status_code == 404
+
+    resp = unauthenticated_client.post(
+        f"/api/cameras/{cam_id}/playlist",
+        content=b"#EXTM3U\n",
+    )
+    assert resp.status_code == 401
+
+
 def test_segment_filename_rejects_path_traversal(
     admin_client, unauthenticated_client, db
 ):
@@ -181,6 +228,30 @@ def test_push_segment_rejects_oversize_via_content_length_header(
     assert "max is 128" in detail
 
 
+def test_push_segment_rejects_oversize_chunked_body(
+    unauthenticated_client, db, monkeypatch
+):
+    """A chunked upload carries no Content-Length, so only the running
+    cap can catch it — it must trip mid-stream rather than after the
+    whole body has been buffered."""
+    from app.core.config import settings
+
+    raw_key, cam_id = _seed_node_with_camera(db)
+    monkeypatch.setattr(settings, "SEGMENT_PUSH_MAX_BYTES", 128)
+
+    def body():
+        for _ in range(4):
+            yield b"\x00" * 64
+
+    resp = unauthenticated_client.post(
+        f"/api/cameras/{cam_id}/push-segment?filename=segment_00001.ts",
+        content=body(),
+        headers={"X-Node-API-Key": raw_key},
+    )
+    assert resp.status_code == 413
+    assert "max of 128" in resp.json()["detail"]
+
+
 def test_push_playlist_rejects_oversize(unauthenticated_client, db, monkeypatch):
     """Playlists are tiny in real life (a few hundred bytes); the cap
     is generous (64 KB default) but enforced — same Content-Length
@@ -606,6 +677,50 @@ def test_get_viewer_seconds_used_warms_cache_from_db(db):
     )
 
 
+def test_flush_viewer_usage_accumulates_across_flushes(db):
+    """The batched UPSERT inserts a new (org, month) row on the first
+    flush and adds to it on the next, refreshing the cache from the
+    returned total each time."""
+    from app.api import hls as hls_mod
+    from app.models.models import OrgMonthlyUsage
+
+    org_id = "org_flush_test"
+    key = (org_id, hls_mod._current_year_month())
+
+    with hls_mod._viewer_usage_lock:
+        hls_mod._pending_viewer_seconds[key] = 30
+    assert hls_mod.flush_viewer_usage() >= 1
+    assert hls_mod._cached_viewer_seconds[key] == 30
+
+    with hls_mod._viewer_usage_lock:
+        hls_mod._pending_viewer_seconds[key] = 12
+    hls_mod.flush_viewer_usage()
+    assert hls_mod._cached_viewer_seconds[key] == 42
+
+    rows = db.query(OrgMonthlyUsage).filter_by(org_id=org_id).all()
+    assert [r.viewer_seconds for r in rows] == [42]
+    hls_mod._cached_viewer_seconds.pop(key, None)
+
+
+def test_warm_viewer_seconds_read_does_not_take_lock():
+    """The per-segment cap check reads a warm cache without the lock,
+    so a writer holding it (e.g. the periodic flush) can't stall
+    segment delivery.  Holding the lock here would deadlock a locking
+    reader; the lock-free path returns cached + pending."""
+    from app.api import hls as hls_mod
+
+    org_id = "org_lockfree_test"
+    key = (org_id, hls_mod._current_year_month())
+    with hls_mod._viewer_usage_lock:
+        hls_mod._cached_viewer_seconds[key] = 100
+        hls_mod._pending_viewer_seconds[key] = 7
+        try:
+            assert hls_mod.get_viewer_seconds_used(org_id) == 107
+        finally:
+            hls_mod._cached_viewer_seconds.pop(key, None)
+            hls_mod._pending_viewer_seconds.pop(key, None)
+
+
 def test_segment_delivery_blocks_when_over_viewer_hour_cap(
     admin_client, unauthenticated_client, db, monkeypatch
 ):
@@ -807,6 +922,53 @@ def test_stream_without_push_returns_404(admin_client, db):
     assert "not started" in resp.json()["detail"].lower()
 
 
+@pytest.fixture
+def _clean_access_log_queue():
+    """The access-log queue and its per-(user, camera) debounce are
+    module globals — start and finish each test with them empty."""
+    from app.api import hls as hls_mod
+
+    hls_mod._pending_access_logs.clear()
+    hls_mod._last_access_logged.clear()
+    yield
+    hls_mod._pending_access_logs.clear()
+    hls_mod._last_access_logged.clear()
+
+
+def test_stream_access_log_is_written_by_flush(admin_client, db, _clean_access_log_queue):
+    """The playlist fetch only queues the access-log row; the periodic
+    flush is what inserts it."""
+    from app.api import hls as hls_mod
+    from app.models.models import StreamAccessLog
+
+    _raw_key, cam_id = _seed_node_with_camera(db)
+    admin_client.get(f"/api/cameras/{cam_id}/stream.m3u8")
+    assert db.query(StreamAccessLog).filter_by(camera_id=cam_id).count() == 0
+
+    assert hls_mod.flush_access_logs() == 1
+    rows = db.query(StreamAccessLog).filter_by(camera_id=cam_id).all()
+    assert len(rows) == 1
+    assert rows[0].org_id == "org_test123"
+
+
+def test_org_wipe_discards_queued_access_logs(admin_client, db, _clean_access_log_queue):
+    """A row queued before delete_org_data must not be re-inserted by the
+    next flush — it carries the viewer's email, IP and user-agent."""
+    from app.api import hls as hls_mod
+    from app.core.gdpr import delete_org_data
+    from app.models.models import StreamAccessLog
+
+    _raw_key, cam_id = _seed_node_with_camera(db)
+    admin_client.get(f"/api/cameras/{cam_id}/stream.m3u8")
+    assert len(hls_mod._pending_access_logs) == 1
+
+    delete_org_data(db, "org_test123")
+    db.commit()
+
+    assert hls_mod.flush_access_logs() == 0
+    assert db.query(StreamAccessLog).filter_by(org_id="org_test123").count() == 0
+
+
 # ── cleanup_camera_cache ─────────────────────────────────────────────
 
 
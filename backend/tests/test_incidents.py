@@ -0,0 +1,213 @@
+"""
+Tests for incident evidence blob handling.
+
+``IncidentEvidence.data`` holds snapshot JPEGs and multi-MB clip .ts
+blobs.  The column is deferred so metadata reads (incident detail,
+evidence listings, the post-insert refresh) never pull the bytes into
+Python; ``has_data`` / ``data_size`` are answered by SQLite instead.
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+from sqlalchemy import inspect
+
+from app.models.models import Incident, IncidentEvidence
+
+ORG = "org_test123"
+
+
+def _seed_clip(db, payload: bytes = b"\x47" * 4096, duration: float = 6.0):
+    """Create an incident with one clip evidence row; return (incident_id, evidence_id)."""
+    incident = Incident(
+        org_id=ORG, title="Gate", summary="Person at gate", created_by="user:test",
+    )
+    db.add(incident)
+    db.flush()
+    evidence = IncidentEvidence(
+        incident_id=incident.id,
+        kind="clip",
+        data=payload,
+        data_mime=f"video/mp2t;duration={duration}",
+    )
+    db.add(evidence)
+    db.commit()
+    return incident.id, evidence.id
+
+
+def test_evidence_metadata_does_not_load_blob(db):
+    """to_dict reports has_data without hydrating the deferred blob."""
+    incident_id, evidence_id = _seed_clip(db)
+    db.expire_all()
+
+    evidence = db.get(IncidentEvidence, evidence_id)
+    d = evidence.to_dict()
+
+    assert d["has_data"] is True
+    assert evidence.data_size == 4096
+    assert "data" in inspect(evidence).unloaded
+
+
+def test_evidence_without_blob_reports_no_data(db):
+    """Observation rows (no blob) report has_data=False and size 0."""
+    incident_id, _ = _seed_clip(db)
+    obs = IncidentEvidence(incident_id=incident_id, kind="observation", text="hi")
+    db.add(obs)
+    db.commit()
+    db.expire_all()
+
+    obs = db.get(IncidentEvidence, obs.id)
+    assert obs.to_dict()["has_data"] is False
+    assert obs.data_size == 0
+
+
+def test_evidence_blob_endpoint_serves_bytes(admin_client, db):
+    """The blob endpoint still returns the full payload with a bare MIME type."""
+    payload = bytes(range(256)) * 64
+    incident_id, evidence_id = _seed_clip(db, payload=payload)
+
+    resp = admin_client.get(f"/api/incidents/{incident_id}/evidence/{evidence_id}")
+    assert resp.status_code == 200
+    assert resp.content == payload
+    assert resp.headers["content-type"] == "video/mp2t"
+
+
+def test_evidence_playlist_uses_stored_duration(admin_client, db):
+    """The synthetic playlist reads the duration MIME parameter."""
+    incident_id, evidence_id = _seed_clip(db, duration=8.0)
+
+    resp = admin_client.get(
+        f"/api/incidents/{incident_id}/evidence/{evidence_id}/playlist.m3u8"
+    )
+    assert resp.status_code == 200
+    assert "#EXTINF:8.000," in resp.text
+    assert "#EXT-X-TARGETDURATION:9" in resp.text
+
+
+def test_evidence_endpoints_are_org_scoped(admin_client, db):
+    """Another org's incident 404s on both evidence endpoints."""
+    incident = Incident(
+        org_id="org_other", title="x", summary="y", created_by="user:other",
+    )
+    db.add(incident)
+    db.flush()
+    evidence = IncidentEvidence(incident_id=incident.id, kind="clip", data=b"abc")
+    db.add(evidence)
+    db.commit()
+
+    base = f"/api/incidents/{incident.id}/evidence/{evidence.id}"
+    assert admin_client.get(base).status_code == 404
+    assert admin_client.get(f"{base}/playlist.m3u8").status_code == 404
+
+
+def test_evidence_blob_streams_in_chunks(admin_client, db, monkeypatch):
+    """Blobs larger than one read chunk arrive intact with Content-Length."""
+    from app.api import incidents
+
+    monkeypatch.setattr(incidents, "_EVIDENCE_CHUNK_BYTES", 1000)
+    payload = bytes(range(251)) * 40  # 10_040 bytes → 11 reads
+    incident_id, evidence_id = _seed_clip(db, payload=payload)
+
+    resp = admin_client.get(f"/api/incidents/{incident_id}/evidence/{evidence_id}")
+    assert resp.status_code == 200
+    assert resp.headers["content-length"] == str(len(payload))
+    assert resp.content == payload
+
+
+def test_evidence_blob_404s_without_data(admin_client, db):
+    """A row with no blob (observation) or an empty one 404s rather than
+    streaming an empty or mismatched body."""
+    incident_id, _ = _seed_clip(db)
+    obs = IncidentEvidence(incident_id=incident_id, kind="observation", text="hi")
+    empty = IncidentEvidence(incident_id=incident_id, kind="snapshot", data=b"")
+    db.add_all([obs, empty])
+    db.commit()
+
+    for evidence_id in (obs.id, empty.id):
+        resp = admin_client.get(f"/api/incidents/{incident_id}/evidence/{evidence_id}")
+        assert resp.status_code == 404
+
+
+def test_evidence_blob_falls_back_to_orm_load(admin_client, db, monkeypatch):
+    """Without stdlib sqlite3 blob I/O the route loads ``data`` through
+    the ORM and still serves it chunked with a Content-Length."""
+    from app.api import incidents
+
+    monkeypatch.setattr(incidents, "_EVIDENCE_BLOB_IO", False)
+    monkeypatch.setattr(incidents, "_EVIDENCE_CHUNK_BYTES", 1000)
+    payload = bytes(range(251)) * 20
+    incident_id, evidence_id = _seed_clip(db, payload=payload)
+    empty = IncidentEvidence(incident_id=incident_id, kind="snapshot", data=b"")
+    db.add(empty)
+    db.commit()
+
+    resp = admin_client.get(f"/api/incidents/{incident_id}/evidence/{evidence_id}")
+    assert resp.status_code == 200
+    assert resp.headers["content-length"] == str(len(payload))
+    assert resp.content == payload
+    assert admin_client.get(
+        f"/api/incidents/{incident_id}/evidence/{empty.id}"
+    ).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_evidence_blob_released_when_client_disconnects(admin_client, db, monkeypatch):
+    """A client that drops mid-stream must not leave the blob handle (and
+    its connection / read snapshot) open.  Drives the ASGI app directly
+    so the disconnect can land after the first body chunk."""
+    from app.api import incidents
+    from app.main import app
+
+    monkeypatch.setattr(incidents, "_EVIDENCE_CHUNK_BYTES", 1000)
+    incident_id, evidence_id = _seed_clip(db, payload=b"x" * 10_000)
+
+    released = []
+    real_close = incidents._close_evidence_blob
+
+    def spy_close(conn, blob):
+        released.append(blob)
+        real_close(conn, blob)
+
+    monkeypatch.setattr(incidents, "_close_evidence_blob", spy_close)
+
+    path = f"/api/incidents/{incident_id}/evidence/{evidence_id}"
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    first_chunk = asyncio.Event()
+    body_chunks = []
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await first_chunk.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            body_chunks.append(message["body"])
+            first_chunk.set()
+            # Hold the stream open so the disconnect wins the race.
+            await asyncio.sleep(0.5)
+
+    await asyncio.wait_for(app(scope, receive, send), timeout=5.0)
+
+    assert 0 < sum(map(len, body_chunks)) < 10_000
+    assert released, "blob was not released after the client disconnected"
+    with pytest.raises(sqlite3.ProgrammingError):
+        released[0].read(1)
@@ -0,0 +1,25 @@
+"""Tests for the public install / MCP setup script routes."""
+
+from app.api import install
+
+
+def test_setup_scripts_are_served_from_memory(unauthenticated_client, monkeypatch):
+    """Scripts are read from disk once per process, then served from the
+    cache — a bot hammering the one-liner doesn't hit the disk."""
+    install._read_script.cache_clear()
+    reads = []
+    real_read_text = install.Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self.name)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(install.Path, "read_text", counting_read_text)
+    try:
+        for _ in range(3):
+            resp = unauthenticated_client.get("/install.sh")
+            assert resp.status_code == 200
+            assert resp.text.startswith("#!")
+        assert reads == ["install.sh"]
+    finally:
+        install._read_script.cache_clear()
@@ -438,3 +438,95 @@ async def test_scope_middleware_ignores_revoked_keys(db):
 
     assert {t.name for t in filtered} == {"list_cameras", "create_incident"}
     assert ran is True  # middleware didn't block — _auth would reject later
+
+
+def test_resolve_org_matches_agent_key_by_digest(monkeypatch):
+    """The multi-tenant agent bearer is recognised (and routed to the
+    override-org path) by comparing SHA-256 digests; anything else —
+    including a non-ASCII bearer that would make compare_digest raise
+    TypeError on raw ``str`` — falls through to the per-org key lookup."""
+    from app.core.config import settings
+    from app.mcp.server import _resolve_org
+
+    monkeypatch.setattr(settings, "SENTINEL_AGENT_MCP_KEY", "agent-mcp-secret")
+
+    with pytest.raises(ToolError, match="X-Agent-Org-Override"):
+        _resolve_org({"authorization": "Bearer agent-mcp-secret"})
+
+    for bearer in ("agent-mcp-secreT", "caf\xe9"):
+        with pytest.raises(ToolError, match="invalid or revoked"):
+            _resolve_org({"authorization": f"Bearer {bearer}"})
+
+
+def test_rate_limiter_windows_are_per_key():
+    """Keys are tracked (and locked) independently — one key tripping
+    its minute cap leaves another key's budget untouched."""
+    from app.mcp.server import _RateLimiter
+
+    limiter = _RateLimiter()
+    assert limiter.check("key_a", 2, 100) == (True, 1, "")
+    assert limiter.check("key_a", 2, 100) == (True, 0, "")
+    assert limiter.check("key_a", 2, 100) == (False, 0, "minute")
+    assert limiter.check("key_b", 2, 100) == (True, 1, "")
+
+
+def test_activity_events_persist_as_one_batch(db):
+    """The activity writer thread hands a drained batch to
+    ``_persist_events``, which must land every row in one commit."""
+    from app.mcp.activity import McpEvent, _persist_events
+    from app.models.models import McpActivityLog
+
+    events = [
+        McpEvent(
+            id=f"evt{i}", timestamp=1_700_000_000.0 + i, tool_name="list_cameras",
+            org_id="org_batch", key_name="Batch Key", status="completed",
+            duration_ms=12.5,
+        )
+        for i in range(3)
+    ]
+    _persist_events(events)
+
+    rows = db.query(McpActivityLog).filter_by(org_id="org_batch").all()
+    assert len(rows) == 3
+    assert {r.duration_ms for r in rows} == {12}
+
+
+@pytest.fixture
+def rearm_activity_writer():
+    """Tests that stop the writer leave it stopped for the whole process;
+    re-arm it afterwards so later tests get the normal queued path."""
+    from app.mcp import activity
+
+    yield
+    activity._reset_persist_writer_for_tests()
+
+
+def test_activity_writer_drains_queue_on_stop(db, rearm_activity_writer):
+    """Events still queued at shutdown are written before the writer exits."""
+    from app.mcp.activity import McpEvent, _enqueue_persist, stop_persist_writer
+    from app.models.models import McpActivityLog
+
+    for i in range(5):
+        _enqueue_persist(McpEvent(
+            id=f"drain{i}", timestamp=1_700_000_000.0 + i, tool_name="list_cameras",
+            org_id="org_drain", key_name="Drain Key", status="completed",
+        ))
+    stop_persist_writer(timeout=5.0)
+
+    assert db.query(McpActivityLog).filter_by(org_id="org_drain").count() == 5
+
+
+def test_activity_events_after_stop_are_written_inline(db, rearm_activity_writer):
+    """An event logged after shutdown must not respawn a writer thread
+    nobody will drain — it's written synchronously instead."""
+    from app.mcp import activity
+    from app.models.models import McpActivityLog
+
+    activity.stop_persist_writer(timeout=5.0)
+    activity._enqueue_persist(activity.McpEvent(
+        id="late1", timestamp=1_700_000_100.0, tool_name="list_cameras",
+        org_id="org_late", key_name="Late Key", status="completed",
+    ))
+
+    assert activity._persist_thread is None
+    assert db.query(McpActivityLog).filter_by(org_id="org_late").count() == 1
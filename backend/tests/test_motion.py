@@ -4,6 +4,7 @@ from datetime import UTC, datetime, timedelta, timezone
 
 from app.api.motion import motion_broadcaster
 from app.models.models import MotionEvent
+from tests.conftest import sse_event
 
 
 def test_list_motion_events_empty(viewer_client):
@@ -99,7 +100,7 @@ def test_motion_broadcaster_delivers():
     motion_broadcaster.notify("org_A", {"camera_id": "cam1", "score": 75})
 
     assert not q.empty()
-    event = q.get_nowait()
+    event = sse_event(q.get_nowait())
     assert event["camera_id"] == "cam1"
     assert event["score"] == 75
 
@@ -110,6 +111,28 @@ def test_motion_broadcaster_delivers():
     motion_broadcaster.unsubscribe("org_B", q_other)
 
 
+def test_motion_broadcaster_lagging_subscriber_keeps_newest():
+    """A subscriber whose queue is full stays subscribed and drops its
+    oldest backlog entry rather than the incoming event."""
+    q = motion_broadcaster.subscribe("org_lag")
+    try:
+        for i in range(q.maxsize):
+            motion_broadcaster.notify("org_lag", {"camera_id": "cam", "score": i})
+        assert q.full()
+
+        motion_broadcaster.notify("org_lag", {"camera_id": "cam", "score": 999})
+
+        assert q.qsize() == q.maxsize
+        assert sse_event(q.get_nowait())["score"] == 1
+        events = [sse_event(q.get_nowait()) for _ in range(q.qsize())]
+        assert events[-1]["score"] == 999
+        # Still wired up — later events keep arriving.
+        motion_broadcaster.notify("org_lag", {"camera_id": "cam", "score": 1000})
+        assert sse_event(q.get_nowait())["score"] == 1000
+    finally:
+        motion_broadcaster.unsubscribe("org_lag", q)
+
+
 def test_motion_broadcaster_unsubscribe():
     """Unsubscribed queues stop receiving events."""
     q = motion_broadcaster.subscribe("org_unsub")
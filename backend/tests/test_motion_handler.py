@@ -4,8 +4,9 @@ from datetime import UTC, datetime, timezone
 
 import pytest
 
-from app.api.ws import _handle_motion_event
-from app.models.models import Camera, CameraNode, MotionEvent
+from app.api.ws import _handle_motion_event, _on_event
+from app.models.models import Camera, CameraNode, MotionEvent, Setting
+from tests.conftest import sse_event
 
 
 def _seed_node_and_cameras(db, node_id="node1", org_id="org_test123", cameras=("cam1", "cam2")):
@@ -135,7 +136,8 @@ async def test_valid_event_persisted_and_broadcast(db):
 
     # SSE broadcast
     assert not q.empty()
-    broadcast = q.get_nowait()
+    # Queues carry the pre-encoded SSE frame.
+    broadcast = sse_event(q.get_nowait())
     assert broadcast["type"] == "motion"
     assert broadcast["camera_id"] == "cam1"
     assert broadcast["score"] == 72
@@ -203,3 +205,25 @@ async def test_rejects_event_for_other_orgs_camera(db):
         "camera_id": "cam-B", "score": 60,
     })
     assert db.query(MotionEvent).count() == 0
+
+
+# ── Ingestion kill switch ───────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_ws_motion_event_respects_ingestion_kill_switch(db):
+    """With ``motion_ingestion_enabled`` off, a WS ``motion_detected``
+    event is dropped before any work — same as the HTTP fallback."""
+    _seed_node_and_cameras(db)
+    Setting.set(db, "org_test123", "motion_ingestion_enabled", "false")
+    event = {
+        "type": "event",
+        "command": "motion_detected",
+        "payload": {"camera_id": "cam1", "score": 80},
+    }
+
+    await _on_event(None, "node1", 1, "org_test123", event)
+    assert db.query(MotionEvent).count() == 0
+
+    Setting.set(db, "org_test123", "motion_ingestion_enabled", "true")
+    await _on_event(None, "node1", 1, "org_test123", event)
+    assert db.query(MotionEvent).count() == 1
@@ -422,6 +422,55 @@ def test_heartbeat_returns_recording_state_per_camera(admin_client, db):
     assert rec_state["cam_idle"] is False
 
 
+def test_heartbeat_bumps_last_seen_for_unchanged_cameras(admin_client):
+    """Cameras re-reporting their current status only get last_seen
+    bumped (bulk path); a camera whose status changed is written in
+    full, error reason included."""
+    from datetime import datetime, timedelta
+
+    from app.models.models import Camera
+    node_id, api_key, _ = _create_and_register(admin_client, version="0.1.43")
+
+    stale = datetime(2020, 1, 1)
+    session = TestSession()
+    try:
+        node = session.query(CameraNode).filter_by(node_id=node_id).first()
+        for cid in ("cam_steady", "cam_failing"):
+            session.add(Camera(
+                camera_id=cid, org_id="org_test123", node_id=node.id,
+                name=cid, status="online", last_seen=stale,
+            ))
+        session.commit()
+    finally:
+        session.close()
+
+    hb = admin_client.post(
+        "/api/nodes/heartbeat",
+        headers={"X-Node-API-Key": api_key},
+        json={
+            "node_id": node_id,
+            "node_version": "0.1.43",
+            "cameras": [
+                {"camera_id": "cam_steady", "status": "online"},
+                {"camera_id": "cam_failing", "status": "failed", "last_error": "boom"},
+            ],
+        },
+    )
+    assert hb.status_code == 200
+
+    session = TestSession()
+    try:
+        cams = {c.camera_id: c for c in session.query(Camera).all()}
+        recent = datetime.now() - timedelta(days=1)
+        assert cams["cam_steady"].status == "online"
+        assert cams["cam_steady"].last_seen > recent
+        assert cams["cam_failing"].status == "failed"
+        assert cams["cam_failing"].last_error == "boom"
+        assert cams["cam_failing"].last_seen > recent
+    finally:
+        session.close()
+
+
 def test_heartbeat_persists_storage_stats(admin_client):
     """v0.1.41+ CloudNodes report filesystem-aware storage stats on
     every heartbeat. The dashboard's per-node usage bar reads from
@@ -11,6 +11,7 @@ Exercises:
   - offline sweep that flips stale 'online' rows
 """
 
+import json
 import time
 from datetime import UTC, datetime, timedelta, timezone
 
@@ -26,6 +27,7 @@ from app.api.notifications import (
 )
 from app.main import run_offline_sweep
 from app.models.models import Camera, CameraNode, Notification, Setting, UserNotificationState
+from tests.conftest import sse_event
 
 
 @pytest.fixture(autouse=True)
@@ -37,6 +39,28 @@ def _reset_transition_debounce():
     clear_transition_debounce()
 
 
+# ── to_dict meta parsing ───────────────────────────────────────────
+
+@pytest.mark.parametrize("raw,expected", [
+    ('{"score": 80}', {"score": 80}),
+    ('  {"score": 80}', {"score": 80}),
+    ('[1, 2]', [1, 2]),
+    ('"123"', "123"),
+    ("true", True),
+    ("42", 42),
+    ("null", None),
+    ("plain legacy text", None),
+    ("{not json", None),
+    (None, None),
+])
+def test_notification_to_dict_meta_parses_any_json_value(raw, expected):
+    """The first-char sniff only skips values that can't be JSON at all;
+    scalars and whitespace-prefixed documents parse exactly as
+    ``json.loads`` would."""
+    notif = Notification(org_id="org_x", kind="motion", title="t", meta_json=raw)
+    assert notif.to_dict()["meta"] == expected
+
+
 # ── List / read-state ──────────────────────────────────────────────
 
 def test_list_notifications_empty(admin_client):
@@ -264,10 +288,10 @@ async def test_broadcaster_delivers_to_matching_audience():
 
     admin_events = []
     while not admin_q.empty():
-        admin_events.append(await admin_q.get())
+        admin_events.append(sse_event(await admin_q.get()))
     viewer_events = []
     while not viewer_q.empty():
-        viewer_events.append(await viewer_q.get())
+        viewer_events.append(sse_event(await viewer_q.get()))
 
     assert [e["title"] for e in admin_events] == ["everyone", "admin only"]
     assert [e["title"] for e in viewer_events] == ["everyone"]
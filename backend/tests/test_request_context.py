@@ -60,6 +60,7 @@ def test_inbound_request_id_honored_when_wellformed(unauthenticated_client):
     "has/slash",                        # invalid character
     "has\nnewline",                     # invalid character (log injection)
     "<script>alert(1)</script>",        # XSS-shaped garbage
+    "café-trace-01".encode("latin-1"),  # non-ASCII letter (isalnum() accepts it)
 ])
 def test_malformed_inbound_request_id_replaced(unauthenticated_client, bad):
     """A garbage X-Request-Id from an attacker shouldn't pollute our
@@ -152,6 +153,101 @@ def test_logging_filter_injects_real_values_when_set():
         request_context.reset_org_id(org_token)
 
 
+def test_queue_handler_stamps_context_before_handoff():
+    """Records are formatted on the QueueListener thread, which has no
+    request contextvars — so the context must already be on the record
+    when it's enqueued from the request's own task."""
+    import queue
+
+    from app.core.logging_setup import _DroppingQueueHandler
+
+    q: queue.Queue = queue.Queue()
+    handler = _DroppingQueueHandler(q)
+    handler.addFilter(ContextFilter())
+
+    rid_token = request_context.set_request_id("abc123")
+    try:
+        handler.handle(logging.LogRecord(
+            name="test", level=logging.INFO, pathname="x", lineno=1,
+            msg="hello %s", args=("world",), exc_info=None,
+        ))
+    finally:
+        request_context.reset_request_id(rid_token)
+
+    rec = q.get_nowait()
+    assert rec.request_id == "abc123"
+    assert rec.getMessage() == "hello world"
+
+
+def test_queue_handler_drops_instead_of_blocking_when_full():
+    """A wedged listener must never back-pressure request handlers:
+    once the queue is full, further records are dropped — and the next
+    record after the queue drains is preceded by a notice with the count."""
+    import queue
+
+    from app.core.logging_setup import _DroppingQueueHandler
+
+    q: queue.Queue = queue.Queue(maxsize=2)
+    handler = _DroppingQueueHandler(q)
+    handler.addFilter(ContextFilter())
+
+    def _log(msg):
+        handler.handle(logging.LogRecord(
+            name="test", level=logging.INFO, pathname="x", lineno=1,
+            msg=msg, args=(), exc_info=None,
+        ))
+
+    for _ in range(4):
+        _log("flood")
+    assert q.qsize() == 2
+
+    q.get_nowait()
+    q.get_nowait()
+    _log("after")
+
+    notice = q.get_nowait()
+    assert notice.levelno == logging.WARNING
+    assert "dropped 2 record(s)" in notice.getMessage()
+    assert notice.request_id == "-"
+    assert q.get_nowait().getMessage() == "after"
+
+
+def test_queue_handler_drop_count_is_exact_across_threads():
+    """Concurrent producers hitting a full queue must not lose drop
+    counts — the notice has to report every record that went missing."""
+    import queue
+    import threading
+
+    from app.core.logging_setup import _DroppingQueueHandler
+
+    q: queue.Queue = queue.Queue(maxsize=1)
+    handler = _DroppingQueueHandler(q)
+    threads_n, per_thread = 8, 500
+
+    def _flood():
+        for _ in range(per_thread):
+            # emit() directly, not handle(): the count must hold up
+            # without relying on the caller having taken the lock.
+            handler.emit(logging.LogRecord(
+                name="test", level=logging.INFO, pathname="x", lineno=1,
+                msg="flood", args=(), exc_info=None,
+            ))
+
+    workers = [threading.Thread(target=_flood) for _ in range(threads_n)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+
+    q.get_nowait()  # the one record that fit
+    handler.emit(logging.LogRecord(
+        name="test", level=logging.INFO, pathname="x", lineno=1,
+        msg="after", args=(), exc_info=None,
+    ))
+    notice = q.get_nowait()
+    assert f"dropped {threads_n * per_thread - 1} record(s)" in notice.getMessage()
+
+
 # Note on testing the auth → set_org_id wiring: the test fixtures
 # (``admin_client`` / ``viewer_client``) bypass the real
 # ``get_current_user`` via ``dependency_overrides``, so the production
@@ -370,6 +370,25 @@ class TestSentinelAgentEndpoints:
         response = agent_client.get("/api/sentinel/runs/pending")
         assert response.status_code == 401
 
+    def test_pending_rejects_non_ascii_agent_key(self, agent_client):
+        """A header with high bytes must 401, not 500 — compare_digest
+        raises TypeError on non-ASCII ``str``, so the compare runs on
+        bytes."""
+        response = agent_client.get(
+            "/api/sentinel/runs/pending",
+            headers={"X-Sentinel-Agent-Key": "caf\xe9".encode("latin-1")},
+        )
+        assert response.status_code == 401
+
+    def test_pending_rejects_same_length_wrong_key(self, agent_client):
+        """Same length as the real key, so the length pre-check passes
+        and the constant-time compare is what rejects it."""
+        response = agent_client.get(
+            "/api/sentinel/runs/pending",
+            headers={"X-Sentinel-Agent-Key": "x" * len(self.AGENT_KEY)},
+        )
+        assert response.status_code == 401
+
     def test_pending_rejects_when_secret_unset(self, db, monkeypatch):
         """Empty SENTINEL_AGENT_KEY must hard-reject every attempt
         (no auto-allow when secret is unset)."""
@@ -769,6 +788,64 @@ class TestDispatchManualRun:
         assert db.query(SentinelConfig).filter_by(org_id="org_t").count() == 1
 
 
+class TestWakeupWebhook:
+    """The fire-and-forget POST that wakes the agent."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_wakeup_client(self):
+        # The real client is process-wide; don't let one built under
+        # another test's agent URL/settings leak in or out of here.
+        from app.core.sentinel_dispatch import close_wakeup_client
+
+        close_wakeup_client()
+        yield
+        close_wakeup_client()
+
+    def test_wakeups_share_one_signed_client(self, monkeypatch):
+        import httpx
+
+        from app.core import sentinel_dispatch
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(204)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(sentinel_dispatch, "_wakeup_client", lambda: client)
+        monkeypatch.setattr(settings, "SENTINEL_AGENT_WEBHOOK_URL", "https://agent.test/wake")
+        monkeypatch.setattr(settings, "SENTINEL_AGENT_KEY", "k" * 32)
+
+        sentinel_dispatch._fire_wakeup_webhook_blocking()
+        sentinel_dispatch._fire_wakeup_webhook_blocking()
+
+        assert len(seen) == 2
+        expected = sentinel_dispatch._compute_signature(b"{}", "k" * 32)
+        assert all(r.headers["X-Sentinel-Signature"] == expected for r in seen)
+        # The shared client is still open — nothing closed it per call.
+        assert not client.is_closed
+        client.close()
+
+    def test_close_wakeup_client_closes_and_rebuilds(self):
+        from app.core import sentinel_dispatch
+
+        first = sentinel_dispatch._wakeup_client()
+        sentinel_dispatch.close_wakeup_client()
+        assert first.is_closed
+
+        # The next wakeup must not post through the closed client.
+        second = sentinel_dispatch._wakeup_client()
+        assert second is not first
+        assert not second.is_closed
+
+    def test_close_wakeup_client_without_client_is_a_noop(self):
+        from app.core import sentinel_dispatch
+
+        sentinel_dispatch.close_wakeup_client()
+        assert sentinel_dispatch._wakeup_client.cache_info().currsize == 0
+
+
 class TestRunsUsedThisMonth:
     """The cap counter — counts every run regardless of outcome
     (pending + running + terminal all bill against the monthly cap)."""
@@ -0,0 +1,17 @@
+"""Tests for the shared org-timezone resolver."""
+
+from zoneinfo import ZoneInfo
+
+from app.core.timezones import resolve_org_timezone
+
+
+def test_resolves_valid_zone():
+    assert resolve_org_timezone("org_test", "Europe/Berlin") == ZoneInfo("Europe/Berlin")
+
+
+def test_missing_or_invalid_zone_falls_back_to_utc():
+    """An unset or hand-edited garbage value must not raise — the
+    heartbeat handler would 500 for the whole org."""
+    assert resolve_org_timezone("org_test", None) == ZoneInfo("UTC")
+    assert resolve_org_timezone("org_test", "Not/AZone") == ZoneInfo("UTC")
+    assert resolve_org_timezone("org_test", "../etc/passwd") == ZoneInfo("UTC")
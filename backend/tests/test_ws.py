@@ -0,0 +1,40 @@
+"""Node WebSocket channel tests."""
+
+import hashlib
+import uuid
+
+from app.models.models import CameraNode
+
+
+def _seed_node(db):
+    """Create a node and return ``(node_id, raw_api_key)``."""
+    raw_key = "raw-key-" + uuid.uuid4().hex
+    node_id = "node_ws_" + uuid.uuid4().hex[:8]
+    db.add(CameraNode(
+        node_id=node_id,
+        org_id="org_test123",
+        api_key_hash=hashlib.sha256(raw_key.encode()).hexdigest(),
+        name="WsTestNode",
+    ))
+    db.commit()
+    return node_id, raw_key
+
+
+def test_unhashable_message_type_gets_error_reply(unauthenticated_client, db):
+    """A list/dict ``type`` (or event ``command``) must be answered as an
+    unknown message, not crash the receive loop and drop the socket."""
+    node_id, raw_key = _seed_node(db)
+
+    with unauthenticated_client.websocket_connect(
+        f"/ws/node?node_id={node_id}&api_key={raw_key}"
+    ) as ws:
+        ws.send_json({"type": ["heartbeat"], "id": "m1"})
+        reply = ws.receive_json()
+        assert reply["type"] == "error"
+        assert reply["id"] == "m1"
+        assert "Unknown message type" in reply["payload"]["detail"]
+
+        # Unhashable event command is ignored; the socket stays usable.
+        ws.send_json({"type": "event", "command": {"x": 1}, "payload": {}})
+        ws.send_json({"type": "nope", "id": "m2"})
+        assert ws.receive_json()["id"] == "m2"